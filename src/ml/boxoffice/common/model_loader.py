@@ -0,0 +1,28 @@
+"""
+模型載入共用模組
+說明: 提供預測階段共用的模型載入邏輯，同一路徑的模型在行程內只讀取一次
+"""
+
+from functools import lru_cache
+from typing import Any, List, Tuple
+
+import joblib
+
+
+@lru_cache(maxsize=4)
+def load_model_cached(model_path: str) -> Tuple[Any, List[str]]:
+    """
+    載入 (model, feature_names) 模型檔，同一路徑重複呼叫會直接回傳快取
+
+    注意：
+        - 以 mmap_mode="r" 載入，模型中的 ndarray 為唯讀且由所有呼叫端共用，
+          只能用來預測，不可重新 fit 或修改
+        - 模型檔更新後需呼叫 load_model_cached.cache_clear() 才會重新讀取
+
+    Args:
+        model_path: 模型檔案路徑字串（joblib.dump 的 (model, feature_names) tuple）
+
+    Returns:
+        (model, feature_names)
+    """
+    return joblib.load(model_path, mmap_mode="r")
@@ -0,0 +1,145 @@
+"""
+訓練資料前處理共用模組
+說明: M1/M2/M3 訓練腳本共用的「讀取 → 排除電影 → 首輪篩選 → 月份編碼」流程，
+      結果以 Parquet 快取，輸入檔、排除清單與前處理程式碼未變動時直接讀取快取
+"""
+
+import hashlib
+from pathlib import Path
+from typing import Tuple, Union
+
+import pandas as pd
+
+from ml.boxoffice.common import feature_engineering
+from ml.boxoffice.common.feature_engineering import BoxOfficeFeatureEngineer
+from ml.common.file_utils import ensure_dir
+from ml.common.path_utils import PHASE3_PREPARE_DIR
+
+# 快取資料夾
+PREPROCESS_CACHE_DIR = Path(PHASE3_PREPARE_DIR) / "_cache"
+
+# 排除清單路徑
+EXCLUDE_CONFIG_PATH = "config/exclude_movies.csv"
+
+# 前處理版本：輸出格式有意變更時手動遞增，讓舊快取失效
+PREPROCESS_VERSION = 1
+
+# 前處理程式碼（本模組與特徵工程模組），內容變動時快取也會失效
+_PREPROCESS_SOURCES = (Path(__file__), Path(feature_engineering.__file__))
+
+
+def _cache_key(input_data_path: Path, exclude_config_path: str) -> str:
+    """以前處理版本、前處理程式碼內容，及輸入檔與排除清單的路徑、大小、修改時間組成快取鍵"""
+    code_hash = hashlib.md5(b"".join(path.read_bytes() for path in _PREPROCESS_SOURCES)).hexdigest()
+    parts = [f"v{PREPROCESS_VERSION}|{code_hash}"]
+    for path in (Path(input_data_path), Path(exclude_config_path)):
+        if path.exists():
+            stat = path.stat()
+            parts.append(f"{path.resolve()}|{stat.st_size}|{stat.st_mtime_ns}")
+        else:
+            parts.append(f"{path}|missing")
+    return hashlib.md5("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+def _cache_paths(input_data_path: Path) -> Tuple[Path, Path]:
+    """
+    每個輸入檔固定一組快取檔：<檔名>_<路徑雜湊>.parquet 與記錄快取鍵的 .key，
+    快取失效時直接覆寫，不會在快取資料夾累積舊的資料副本
+    """
+    path = Path(input_data_path)
+    path_hash = hashlib.md5(str(path.resolve()).encode("utf-8")).hexdigest()[:8]
+    name = f"{path.stem}_{path_hash}"
+    return PREPROCESS_CACHE_DIR / f"{name}.parquet", PREPROCESS_CACHE_DIR / f"{name}.key"
+
+
+def exclude_movies(
+    df: pd.DataFrame, exclude_config_path: str = EXCLUDE_CONFIG_PATH
+) -> pd.DataFrame:
+    """依排除清單移除指定的電影"""
+    try:
+        exclude_df = pd.read_csv(exclude_config_path, comment="#")
+        exclude_gov_ids = exclude_df["gov_id"].dropna().astype(int).tolist()
+
+        if len(exclude_gov_ids) > 0:
+            print(f"\n從 {exclude_config_path} 讀取排除清單:")
+            print(f"  發現 {len(exclude_gov_ids)} 部需要排除的電影")
+            print(f"  排除的 gov_id: {exclude_gov_ids}")
+
+            # 檢查有多少筆資料會被排除
+            exclude_count = df[df["gov_id"].isin(exclude_gov_ids)].shape[0]
+            exclude_movie_count = df[df["gov_id"].isin(exclude_gov_ids)]["gov_id"].nunique()
+            print(f"  將排除 {exclude_movie_count} 部電影，共 {exclude_count} 筆資料")
+
+            # 執行排除
+            df = df[~df["gov_id"].isin(exclude_gov_ids)]
+            print(f"  排除後剩餘資料筆數: {len(df)}")
+        else:
+            print(f"\n{exclude_config_path} 中沒有需要排除的電影")
+
+    except FileNotFoundError:
+        print(f"\n警告: 找不到排除清單檔案 {exclude_config_path}，跳過排除步驟")
+    except Exception as e:
+        print(f"\n警告: 讀取排除清單時發生錯誤: {e}，跳過排除步驟")
+
+    return df
+
+
+def filter_first_round(df: pd.DataFrame) -> pd.DataFrame:
+    """只保留首輪、有活躍週次，且第 1、2 週都有票房的資料"""
+    # 篩選結果不需 .copy()：後續只再篩選與 drop，月份編碼時 add_features_to_dataframe 會自行複製
+    df = df[df["round_idx"] == 1]
+    # 只保留有活躍週次的資料
+    df = df[df["current_week_active_idx"].notna()]
+    # 必須同時有 week_1 和 week_2 的資料,且都不為 0
+    df = df[
+        (df["boxoffice_week_1"].notna())
+        & (df["boxoffice_week_1"] > 0)
+        & (df["boxoffice_week_2"].notna())
+        & (df["boxoffice_week_2"] > 0)
+    ]
+    print(f"基本篩選後資料筆數: {len(df)}")
+    return df
+
+
+def load_preprocessed_dataset(
+    input_data_path: Union[str, Path],
+    exclude_config_path: str = EXCLUDE_CONFIG_PATH,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    """
+    讀取訓練資料並完成共用前處理（排除電影、首輪篩選、月份週期性編碼）
+
+    各模型專屬的欄位刪除不在此處理，由各訓練腳本自行決定。
+
+    Args:
+        input_data_path: phase3 訓練資料 CSV
+        exclude_config_path: 排除清單 CSV
+        use_cache: 是否使用 / 寫入 Parquet 快取
+
+    Returns:
+        前處理後的 DataFrame
+    """
+    cache_key = _cache_key(input_data_path, exclude_config_path)
+    cache_path, key_path = _cache_paths(input_data_path)
+
+    if use_cache and cache_path.exists() and key_path.exists() and key_path.read_text() == cache_key:
+        df = pd.read_parquet(cache_path)
+        print(f"♻️ 使用前處理快取: {cache_path.name}（輸入檔與排除清單未變動）")
+        print(f"基本篩選後資料筆數: {len(df)}")
+        return df
+
+    # 以 pyarrow 多執行緒解析 CSV（日期欄位會被解析成 date，但後續只會刪除不使用）
+    df = pd.read_csv(input_data_path, engine="pyarrow")
+    df = exclude_movies(df, exclude_config_path)
+    df = filter_first_round(df)
+
+    # 月份週期性編碼
+    df = BoxOfficeFeatureEngineer.add_features_to_dataframe(df, group_by_col="gov_id")
+
+    if use_cache:
+        ensure_dir(str(PREPROCESS_CACHE_DIR))
+        df.to_parquet(cache_path)
+        # 快取鍵在資料寫完後才更新，寫入中斷時舊的 .key 對不上，下次會重新前處理
+        key_path.write_text(cache_key)
+
+    return df
@@ -0,0 +1,83 @@
+"""
+決策樹陣列預測模組
+說明: 將訓練好的 DecisionTreeRegressor 匯出為純 numpy 陣列，部署時不需 sklearn 即可批次預測
+"""
+
+from pathlib import Path
+from typing import Dict, Union
+
+import numpy as np
+
+
+def export_tree_arrays(dt_model) -> Dict[str, np.ndarray]:
+    """
+    從已訓練的 DecisionTreeRegressor 匯出走訪所需的陣列
+
+    Args:
+        dt_model: 已 fit 的 sklearn DecisionTreeRegressor
+
+    Returns:
+        {feature, threshold, children_left, children_right, missing_go_to_left, leaf_value}
+    """
+    tree = dt_model.tree_
+    # 舊版 sklearn（< 1.3）不支援缺失值，沒有 missing_go_to_left，NaN 一律走右子樹
+    missing_go_to_left = getattr(tree, "missing_go_to_left", np.zeros(tree.node_count, dtype=np.uint8))
+    return {
+        "feature": tree.feature.astype(np.intp),
+        "threshold": tree.threshold.astype(np.float64),
+        "children_left": tree.children_left.astype(np.intp),
+        "children_right": tree.children_right.astype(np.intp),
+        "missing_go_to_left": np.asarray(missing_go_to_left).astype(bool),
+        "leaf_value": tree.value[:, 0, 0].astype(np.float64),
+    }
+
+
+def save_tree_arrays(dt_model, file_path: Union[str, Path]) -> None:
+    """將決策樹陣列存成 .npz"""
+    np.savez(file_path, **export_tree_arrays(dt_model))
+
+
+def load_tree_arrays(file_path: Union[str, Path]) -> Dict[str, np.ndarray]:
+    """讀取 save_tree_arrays 產生的 .npz"""
+    with np.load(file_path) as data:
+        return {key: data[key] for key in data.files}
+
+
+def predict_tree_arrays(X: np.ndarray, arrays: Dict[str, np.ndarray]) -> np.ndarray:
+    """
+    以匯出的陣列批次預測
+
+    所有樣本同時往下走一層，迴圈次數等於樹深，而不是樣本數；
+    分裂規則與 sklearn 相同（X 先轉 float32，X[feature] <= threshold 走左子樹；
+    NaN 依 missing_go_to_left 決定方向）
+
+    Args:
+        X: (k, n) 特徵矩陣，欄位順序須與訓練時相同
+        arrays: export_tree_arrays / load_tree_arrays 的回傳值
+
+    Returns:
+        (k,) 預測值
+    """
+    X = np.asarray(X, dtype=np.float32)
+    feature = arrays["feature"]
+    threshold = arrays["threshold"]
+    left = arrays["children_left"]
+    right = arrays["children_right"]
+    # 舊的 .npz 沒有 missing_go_to_left，NaN 維持走右子樹
+    missing_left = arrays.get("missing_go_to_left")
+    if missing_left is None:
+        missing_left = np.zeros(len(feature), dtype=bool)
+
+    rows = np.arange(X.shape[0])
+    node = np.zeros(X.shape[0], dtype=np.intp)
+    active = left[node] != -1
+
+    while active.any():
+        idx = rows[active]
+        cur = node[idx]
+        values = X[idx, feature[cur]]
+        go_left = np.where(np.isnan(values), missing_left[cur], values <= threshold[cur])
+        node[idx] = np.where(go_left, left[cur], right[cur])
+        active[idx] = left[node[idx]] != -1
+
+    return arrays["leaf_value"][node]
@@ -88,12 +88,26 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
 # 加入共用模組路徑
 sys.path.append(str(Path(__file__).parent.parent.parent))
 from ml.common.file_utils import ensure_dir, save_csv
 
+# 讀取逐部電影 CSV 的執行緒數（pandas C parser 解析時會釋放 GIL）
+READ_WORKERS = 8
+
+
+def read_permovie_csv(file: Path):
+    """讀取單部電影週資料並補上 gov_id，回傳 (DataFrame, 錯誤)；失敗時 DataFrame 為 None"""
+    try:
+        df = pd.read_csv(file)
+        df["gov_id"] = file.stem.split("_")[0]
+        return df, None
+    except Exception as e:
+        return None, e
+
 
 def generate_data_quality_report(df, output_path):
     """
@@ -126,8 +140,8 @@ def generate_data_quality_report(df, output_path):
     early_weeks_zero = []
     early_weeks_zero_movies = set()
 
-    for gov_id in df['gov_id'].unique():
-        movie_df = df[df['gov_id'] == gov_id]
+    # 以 groupby 一次切出各電影（依出現順序），不必每部電影都對整欄 gov_id 字串做比對
+    for gov_id, movie_df in df.groupby('gov_id', sort=False):
         for round_idx in movie_df['round_idx'].unique():
             round_df = movie_df[movie_df['round_idx'] == round_idx].copy()
             round_df = round_df.sort_values('current_week_real_idx')
@@ -269,14 +283,14 @@ def flatten_timeseries():
 
     print(f"📁 找到 {len(all_files)} 部電影")
 
+    # 上千支小檔案以執行緒池並行讀取（map 保持原本檔案順序）
     all_data = []
-    for file in all_files:
-        try:
-            df = pd.read_csv(file)
-            df["gov_id"] = file.stem.split("_")[0]
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as pool:
+        for file, (df, error) in zip(all_files, pool.map(read_permovie_csv, all_files)):
+            if error is not None:
+                print(f"⚠️ 跳過 {file.name}: {error}")
+                continue
             all_data.append(df)
-        except Exception as e:
-            print(f"⚠️ 跳過 {file.name}: {e}")
 
     df_all = pd.concat(all_data, ignore_index=True)
     print(f"✅ 載入完成：{len(df_all):,} 筆週資料")
@@ -295,8 +309,8 @@ def flatten_timeseries():
     filtered_list = []
     filtered_count = 0
 
-    for gov_id in df_all["gov_id"].unique():
-        movie_df = df_all[df_all["gov_id"] == gov_id].copy()
+    for gov_id, movie_df in df_all.groupby("gov_id", sort=False):
+        movie_df = movie_df.copy()
 
         if len(movie_df) == 0:
             continue
@@ -311,7 +325,7 @@ def flatten_timeseries():
                 try:
                     release_date = datetime.strptime(release_date_str, fmt)
                     break
-                except:
+                except (ValueError, TypeError):
                     continue
 
             if release_date is None:
@@ -319,22 +333,21 @@ def flatten_timeseries():
                 continue
 
             # 過濾：只保留週次區間的結束日 >= 上映日的資料
-            valid_rows = []
-            for idx, row in movie_df.iterrows():
-                week_range = row["week_range"]
+            # 只走訪 week_range 一欄建立布林遮罩，再一次切出（不必每列建立 Series）
+            keep = []
+            for week_range in movie_df["week_range"]:
                 try:
                     # 取週次區間的結束日
                     week_end_str = week_range.split("~")[1]
                     week_end = datetime.strptime(week_end_str, "%Y-%m-%d")
 
                     # 如果週次結束日 >= 上映日，保留
-                    if week_end >= release_date:
-                        valid_rows.append(row)
+                    keep.append(week_end >= release_date)
                 except Exception as e:
-                    continue
+                    keep.append(False)
 
-            if len(valid_rows) > 0:
-                filtered_movie_df = pd.DataFrame(valid_rows)
+            if any(keep):
+                filtered_movie_df = movie_df[keep]
                 filtered_list.append(filtered_movie_df)
                 filtered_count += len(movie_df) - len(filtered_movie_df)
             else:
@@ -359,8 +372,8 @@ def flatten_timeseries():
 
     result_list = []
 
-    for gov_id in df_all["gov_id"].unique():
-        movie_df = df_all[df_all["gov_id"] == gov_id].copy().reset_index(drop=True)
+    for gov_id, movie_df in df_all.groupby("gov_id", sort=False):
+        movie_df = movie_df.copy().reset_index(drop=True)
 
         # 保存原始索引（用於計算跳週）
         movie_df["original_real_idx"] = range(1, len(movie_df) + 1)
@@ -477,11 +490,11 @@ def flatten_timeseries():
         active_indices = []
         for round_num in movie_df["round_idx"].unique():
             round_mask = movie_df["round_idx"] == round_num
-            round_data = movie_df[round_mask].copy()
+            round_data = movie_df[round_mask]
 
             active_idx = 0
-            for idx, row in round_data.iterrows():
-                if row["has_boxoffice"] == 1:
+            for row in round_data.itertuples(index=False):
+                if row.has_boxoffice == 1:
                     active_idx += 1
                     active_indices.append(active_idx)
                 else:
@@ -590,7 +603,7 @@ def flatten_timeseries():
                         try:
                             release_date = datetime.strptime(release_date_str, fmt)
                             break
-                        except:
+                        except (ValueError, TypeError):
                             continue
 
                     week_range = first_week["week_range"]
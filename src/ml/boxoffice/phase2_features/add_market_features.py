@@ -48,6 +48,9 @@ from ml.common.path_utils import (
     PHASE2_WITH_MARKET_DIR
 )
 
+# 檔名中的日期（格式: YYYY-MM-DD），模組載入時編譯一次
+FILENAME_DATE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})')
+
 
 def find_latest_file(directory, pattern):
     """
@@ -72,11 +75,9 @@ def find_latest_file(directory, pattern):
         return None
 
     # 從檔名中提取日期（格式: YYYY-MM-DD）
-    date_pattern = r'(\d{4}-\d{2}-\d{2})'
-
     files_with_dates = []
     for file in files:
-        match = re.search(date_pattern, file.name)
+        match = FILENAME_DATE_RE.search(file.name)
         if match:
             date_str = match.group(1)
             files_with_dates.append((file, date_str))
@@ -169,9 +170,12 @@ def calculate_avg_ticket_price(df):
     for _, row in price_mapping.iterrows():
         print(f"  {int(row['week_year'])} 年 {row['round_type']}: {int(row['ticket_price_avg'])} 元/張")
 
-    # Merge 回原始資料（根據每個 row 的 week_year 來對應票價）
-    df = df.merge(price_mapping, on=['week_year', 'round_type'], how='left')
-    df.rename(columns={'ticket_price_avg': 'ticket_price_avg_current'}, inplace=True)
+    # 對應回原始資料（根據每個 row 的 week_year + 輪次類型查票價）
+    # 對照表只有「年份數 × 2」筆，用索引查表取代 merge，不需重建整張表
+    price_lookup = price_mapping.set_index(['week_year', 'round_type'])['ticket_price_avg']
+    df['ticket_price_avg_current'] = pd.MultiIndex.from_frame(
+        df[['week_year', 'round_type']]
+    ).map(price_lookup).to_numpy()
 
     # 刪除輔助欄位
     df.drop(columns=['week_year', 'round_type'], inplace=True)
@@ -190,21 +194,27 @@ def add_movie_info(boxoffice_df, movie_info_path):
     Returns:
         合併後的 DataFrame
     """
-    # 讀取電影資訊
-    movie_df = pd.read_csv(movie_info_path, encoding='utf-8-sig')
+    # 讀取電影資訊（只解析需要的欄位；region / publisher 種類少但會隨週次重複展開，
+    # 讀取時直接轉 category 再合併，存成 CSV 內容不變）
+    movie_cols = ['gov_id', 'region', 'rating', 'publisher', 'film_length']
+    movie_df = pd.read_csv(
+        movie_info_path,
+        encoding='utf-8-sig',
+        usecols=movie_cols,
+        dtype={'region': 'category', 'publisher': 'category'},
+    )[movie_cols]  # usecols 依檔案欄位順序回傳，這裡固定成 movie_cols 順序
 
-    print(f"  電影資訊檔: {len(movie_df)} 部電影")
+    # 同一 gov_id 可能有多筆（例如重映版片名不同），保留最後一筆
+    movie_df = movie_df.drop_duplicates('gov_id', keep='last')
 
-    # 選取需要的欄位
-    movie_cols = ['gov_id', 'region', 'rating', 'publisher', 'film_length']
-    movie_df = movie_df[movie_cols]
+    print(f"  電影資訊檔: {len(movie_df)} 部電影")
 
     # 轉換 rating 為 is_restricted
     movie_df['is_restricted'] = movie_df['rating'].apply(convert_rating_to_restricted)
     movie_df.drop(columns=['rating'], inplace=True)
 
-    # 合併（使用 left join 保留所有票房資料）
-    result_df = boxoffice_df.merge(movie_df, on='gov_id', how='left')
+    # 合併（使用 left join 保留所有票房資料；validate 確保每個 gov_id 只對應一筆電影資訊，避免重複展開列數）
+    result_df = boxoffice_df.merge(movie_df, on='gov_id', how='left', validate='m:1')
 
     # 檢查是否有未匹配的電影
     unmatched = result_df[result_df['region'].isna()]['gov_id'].nunique()
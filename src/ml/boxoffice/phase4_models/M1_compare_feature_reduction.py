@@ -13,12 +13,13 @@ from datetime import datetime
 from sklearn.linear_model import LinearRegression
 from sklearn.model_selection import GroupShuffleSplit
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+from joblib import Parallel, delayed
 import matplotlib.pyplot as plt
 import seaborn as sns
 
 from ml.common.file_utils import ensure_dir
 from ml.common.path_utils import PHASE3_PREPARE_DIR, PHASE4_MODELS_DIR
-from ml.boxoffice.common.feature_engineering import BoxOfficeFeatureEngineer
+from ml.boxoffice.common.train_preprocess import load_preprocessed_dataset
 
 # ===================================================================
 # 全域設定
@@ -39,33 +40,8 @@ print("=" * 70)
 # 資料預處理
 # ===================================================================
 print("\n[DATA] 讀取資料...")
-df = pd.read_csv(input_data_path)
-
-# 排除指定的電影
-exclude_config_path = "config/exclude_movies.csv"
-try:
-    exclude_df = pd.read_csv(exclude_config_path, comment="#")
-    exclude_gov_ids = exclude_df["gov_id"].dropna().astype(int).tolist()
-    if len(exclude_gov_ids) > 0:
-        print(f"排除 {len(exclude_gov_ids)} 部電影")
-        df = df[~df["gov_id"].isin(exclude_gov_ids)].copy()
-except:
-    pass
-
-# 篩選資料
-df = df[df["round_idx"] == 1].copy()
-df = df[df["current_week_active_idx"].notna()]
-df = df[
-    (df["boxoffice_week_1"].notna())
-    & (df["boxoffice_week_1"] > 0)
-    & (df["boxoffice_week_2"].notna())
-    & (df["boxoffice_week_2"] > 0)
-]
-
-print(f"資料筆數: {len(df)}")
-
-# 月份週期性編碼
-df = BoxOfficeFeatureEngineer.add_features_to_dataframe(df, group_by_col='gov_id')
+# 讀取資料、排除指定電影、篩選首輪資料、月份週期性編碼（與 M1/M2/M3 共用前處理與 Parquet 快取）
+df = load_preprocessed_dataset(input_data_path)
 
 # 刪除基本不需要的欄位
 drop_columns = [
@@ -114,27 +90,35 @@ scenarios = {
 # ===================================================================
 # 測試每個方案
 # ===================================================================
-results = []
+def evaluate_scenario(scenario_name, config):
+    """
+    訓練並評估單一方案
+
+    各方案彼此獨立，會以多執行緒同時執行；輸出訊息先收集起來，
+    全部完成後再依方案順序印出，避免不同方案的訊息交錯
 
-for scenario_name, config in scenarios.items():
-    print("\n" + "=" * 70)
-    print(f"[SCENARIO] 測試方案: {scenario_name}")
-    print(f"說明: {config['description']}")
-    print("=" * 70)
+    Returns:
+        (評估結果 dict, 輸出訊息 list)
+    """
+    lines = []
+    lines.append("\n" + "=" * 70)
+    lines.append(f"[SCENARIO] 測試方案: {scenario_name}")
+    lines.append(f"說明: {config['description']}")
+    lines.append("=" * 70)
 
-    # 準備資料
-    df_test = df.copy()
+    # 準備資料（drop 會回傳新的 DataFrame，不會改到共用的 df）
+    df_test = df
 
     # 刪除指定的特徵
     if config['drop']:
-        print(f"\n刪除特徵: {config['drop']}")
+        lines.append(f"\n刪除特徵: {config['drop']}")
         df_test = df_test.drop(columns=config['drop'], errors='ignore')
 
     # 分離特徵與目標
     X = df_test.drop(columns=["amount"])
     y = df_test["amount"]
 
-    print(f"\n特徵數量: {X.shape[1] - 1} (不含 gov_id)")
+    lines.append(f"\n特徵數量: {X.shape[1] - 1} (不含 gov_id)")
 
     # 切分資料集
     splitter = GroupShuffleSplit(test_size=0.2, n_splits=1, random_state=42)
@@ -167,15 +151,14 @@ for scenario_name, config in scenarios.items():
                 high_corr_count += 1
 
     # 顯示結果
-    print(f"\n[RESULT] 評估結果:")
-    print(f"  MAE:  {mae:,.0f} 元")
-    print(f"  RMSE: {rmse:,.0f} 元")
-    print(f"  R2:   {r2:.4f}")
-    print(f"  MAPE: {mape:.2f}%")
-    print(f"  高相關特徵對 (|r|>0.8): {high_corr_count} 對")
-
-    # 儲存結果
-    results.append({
+    lines.append(f"\n[RESULT] 評估結果:")
+    lines.append(f"  MAE:  {mae:,.0f} 元")
+    lines.append(f"  RMSE: {rmse:,.0f} 元")
+    lines.append(f"  R2:   {r2:.4f}")
+    lines.append(f"  MAPE: {mape:.2f}%")
+    lines.append(f"  高相關特徵對 (|r|>0.8): {high_corr_count} 對")
+
+    result = {
         "方案": scenario_name,
         "特徵數": X_train_model.shape[1],
         "MAE": mae,
@@ -184,7 +167,21 @@ for scenario_name, config in scenarios.items():
         "MAPE": mape,
         "高相關對數": high_corr_count,
         "刪除特徵": ", ".join(config['drop']) if config['drop'] else "無",
-    })
+    }
+    return result, lines
+
+
+# 各方案同時訓練（資料量小，使用執行緒即可，不需複製資料到子行程）
+scenario_outputs = Parallel(n_jobs=len(scenarios), prefer="threads")(
+    delayed(evaluate_scenario)(scenario_name, config)
+    for scenario_name, config in scenarios.items()
+)
+
+# 依方案順序輸出訊息並儲存結果
+results = []
+for result, lines in scenario_outputs:
+    print("\n".join(lines))
+    results.append(result)
 
 # ===================================================================
 # 生成比較報告
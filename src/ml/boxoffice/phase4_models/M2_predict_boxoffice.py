@@ -9,11 +9,11 @@ if str(src_path) not in sys.path:
 
 import pandas as pd
 import numpy as np
-from ml.common.file_utils import ensure_dir
+from ml.common.file_utils import ensure_dir, save_csv_with_parquet
 from io import StringIO
 from datetime import datetime
 from ml.common.path_utils import PHASE3_PREPARE_DIR, PHASE4_MODELS_DIR
-from ml.boxoffice.common.feature_engineering import BoxOfficeFeatureEngineer
+from ml.boxoffice.common.train_preprocess import load_preprocessed_dataset
 
 # ===================================================================
 # 全域設定
@@ -33,6 +33,9 @@ ensure_dir(output_model_dir)
 # 使用的訓練資料集
 input_data_path = Path(PHASE3_PREPARE_DIR) / "M2_train_dataset" / "features_market_2025-11-07.csv"
 
+# 類別欄位：不做 OneHot，轉成 category 後交給 LightGBM 原生類別分裂
+CATEGORICAL_COLS = ["region", "publisher"]
+
 # ===================================================================
 # 日誌系統設定
 # ===================================================================
@@ -45,14 +48,16 @@ class Logger:
     def __init__(self, log_buffer):
         self.terminal = sys.stdout
         self.log = log_buffer
+        # 處理 Windows 終端機編碼問題：啟動時判斷一次終端機編碼，之後每次 write 只需檢查布林值
+        self._encoding = getattr(self.terminal, "encoding", None) or "ascii"
+        self._is_utf = self._encoding.lower().replace("-", "").startswith("utf")
 
     def write(self, message):
-        # 處理 Windows 終端機編碼問題
-        try:
+        if self._is_utf:
             self.terminal.write(message)
-        except UnicodeEncodeError:
+        else:
             # 移除無法編碼的字符
-            clean_message = message.encode("ascii", "ignore").decode("ascii")
+            clean_message = message.encode(self._encoding, "ignore").decode(self._encoding)
             self.terminal.write(clean_message)
         self.log.write(message)
 
@@ -71,58 +76,9 @@ print("=" * 60)
 # ===================================================================
 # 資料預處理
 # ===================================================================
-# === 1. 讀取資料 ===
-df = pd.read_csv(input_data_path)
-
-
-# === 2-1. 排除指定的電影 ===
-# 排除清單路徑
-exclude_config_path = "config/exclude_movies.csv"
-
-try:
-    exclude_df = pd.read_csv(exclude_config_path, comment="#")
-    exclude_gov_ids = exclude_df["gov_id"].dropna().astype(int).tolist()
-
-    if len(exclude_gov_ids) > 0:
-        print(f"\n從 {exclude_config_path} 讀取排除清單:")
-        print(f"  發現 {len(exclude_gov_ids)} 部需要排除的電影")
-        print(f"  排除的 gov_id: {exclude_gov_ids}")
-
-        # 檢查有多少筆資料會被排除
-        exclude_count = df[df["gov_id"].isin(exclude_gov_ids)].shape[0]
-        exclude_movie_count = df[df["gov_id"].isin(exclude_gov_ids)]["gov_id"].nunique()
-        print(f"  將排除 {exclude_movie_count} 部電影，共 {exclude_count} 筆資料")
-
-        # 執行排除
-        df = df[~df["gov_id"].isin(exclude_gov_ids)].copy()
-        print(f"  排除後剩餘資料筆數: {len(df)}")
-    else:
-        print(f"\n{exclude_config_path} 中沒有需要排除的電影")
-
-except FileNotFoundError:
-    print(f"\n警告: 找不到排除清單檔案 {exclude_config_path}，跳過排除步驟")
-except Exception as e:
-    print(f"\n警告: 讀取排除清單時發生錯誤: {e}，跳過排除步驟")
-
-
-# === 2-2. 篩選資料 ===
-# 只保留首輪資料
-df = df[df["round_idx"] == 1].copy()
-# 只保留有活躍週次的資料
-df = df[df["current_week_active_idx"].notna()]
-# 必須同時有 week_1 和 week_2 的資料,且都不為 0
-df = df[
-    (df["boxoffice_week_1"].notna())
-    & (df["boxoffice_week_1"] > 0)
-    & (df["boxoffice_week_2"].notna())
-    & (df["boxoffice_week_2"] > 0)
-]
-print(f"基本篩選後資料筆數: {len(df)}")
-
-
-# === 3. 月份週期性編碼 ===
-# 使用共用特徵工程模組進行編碼
-df = BoxOfficeFeatureEngineer.add_features_to_dataframe(df, group_by_col='gov_id')
+# === 1~3. 讀取資料、排除指定電影、篩選首輪資料、月份週期性編碼 ===
+# M1/M2/M3 共用同一段前處理，輸入檔與排除清單未變動時直接讀取 Parquet 快取
+df = load_preprocessed_dataset(input_data_path)
 
 
 # === 4. 刪除不需要的欄位 ===
@@ -145,23 +101,25 @@ drop_columns = [
     "rounds_cumsum",
     # 問題欄位
     "ticket_price_avg_current",
-    # 分類欄位 (時間有限先刪除)
-    "region",
-    "publisher",
     # 已編碼的原始欄位
     "release_month",
 ]
 
 df = df.drop(columns=drop_columns)
 
+# 分類欄位轉 category（LightGBM 直接使用類別代碼，不需展開成 dummy 欄位）
+df[CATEGORICAL_COLS] = df[CATEGORICAL_COLS].astype("category")
+
 
 # === 5. 檢查缺失值 ===
 print("\n=== 缺失值檢查 ===")
-print(df.isnull().sum()[df.isnull().sum() > 0])
+# 先找出有缺失的欄位，只對這些欄位計數，避免整張表做兩次 isnull().sum()
+missing_cols = df.columns[df.isna().any().to_numpy()]
+print(df[missing_cols].isna().sum())
 
 
 # === 6. 存檔: 完整資料 (含 amount 和 gov_id) ===
-df.to_csv(output_prepare_dir / "preprocessed_full.csv", index=False, encoding="utf-8-sig")
+save_csv_with_parquet(df, output_prepare_dir / "preprocessed_full.csv")
 print(f"\n✅ 已存檔: {output_prepare_dir / 'preprocessed_full.csv'}")
 print("📍資料數量小計:")
 print(f"   欄位數: {len(df.columns)}")
@@ -177,16 +135,12 @@ for i, col in enumerate(df.columns, 1):
 # === 8. 存檔: 訓練用特徵 (移除 amount，保留 gov_id 用於分組) ===
 feature_cols = [col for col in df.columns if col != "amount"]
 df_features = df[feature_cols]
-df_features.to_csv(
-    output_prepare_dir / "preprocessed_features.csv", index=False, encoding="utf-8-sig"
-)
+save_csv_with_parquet(df_features, output_prepare_dir / "preprocessed_features.csv")
 print(f"\n✅ 已存檔: {output_prepare_dir / 'preprocessed_features.csv'}")
 
 
 # === 9. 存檔: 目標變數 ===
-df[["gov_id", "amount"]].to_csv(
-    output_prepare_dir / "preprocessed_target.csv", index=False, encoding="utf-8-sig"
-)
+save_csv_with_parquet(df[["gov_id", "amount"]], output_prepare_dir / "preprocessed_target.csv")
 print(f"✅ 已存檔: {output_prepare_dir / 'preprocessed_target.csv'}")
 
 
@@ -209,10 +163,12 @@ print("\n" + "=" * 50)
 print("🔍 特徵與目標相關性 (Top 10)")
 print("=" * 50)
 
+# 相關性只計算數值欄位（類別欄位不適用）
+X_numeric = X.drop(columns=["gov_id"]).select_dtypes("number")
 correlation = pd.DataFrame(
     {
-        "feature": X.drop(columns=["gov_id"]).columns,
-        "correlation": X.drop(columns=["gov_id"]).corrwith(y),
+        "feature": X_numeric.columns,
+        "correlation": X_numeric.corrwith(y),
     }
 ).sort_values("correlation", key=abs, ascending=False)
 
@@ -246,13 +202,14 @@ print("\n" + "=" * 50)
 print("🔍 訓練集缺失值檢查")
 print("=" * 50)
 
-missing_train = X_train_model.isnull().sum()
-missing_train = missing_train[missing_train > 0].sort_values(ascending=False)
+missing_cols = X_train_model.columns[X_train_model.isna().any().to_numpy()]
 
-if len(missing_train) > 0:
+if len(missing_cols) > 0:
+    missing_train_df = X_train_model[missing_cols].isna()
+    missing_train = missing_train_df.sum().sort_values(ascending=False)
     print("⚠️ 發現缺失值:")
     print(missing_train)
-    print(f"\n總缺失筆數: {X_train_model.isnull().any(axis=1).sum()}/{len(X_train_model)}")
+    print(f"\n總缺失筆數: {missing_train_df.any(axis=1).sum()}/{len(X_train_model)}")
 else:
     print("✅ 無缺失值")
 
@@ -273,7 +230,7 @@ lgb_model = lgb.LGBMRegressor(
     verbose=-1,  # 關閉訓練過程輸出
 )
 
-lgb_model.fit(X_train_model, y_train)
+lgb_model.fit(X_train_model, y_train, categorical_feature=CATEGORICAL_COLS)
 
 y_pred_lgb = lgb_model.predict(X_test_model)
 
@@ -290,9 +247,12 @@ print("\n" + "=" * 50)
 print("📊 Top 10 重要特徵 (LightGBM)")
 print("=" * 50)
 
+# 先用 numpy 取得由大到小的順序，再一次建表（不需事後 sort_values）
+importances = lgb_model.feature_importances_
+order = np.argsort(-importances, kind="stable")
 feature_importance = pd.DataFrame(
-    {"feature": X_train_model.columns, "importance": lgb_model.feature_importances_}
-).sort_values("importance", ascending=False)
+    {"feature": X_train_model.columns[order], "importance": importances[order]}
+)
 
 print(feature_importance.head(10).to_string(index=False))
 
@@ -331,8 +291,8 @@ print("\n" + "=" * 50)
 print("🔥 特徵相關性熱力圖")
 print("=" * 50)
 
-# 計算相關性矩陣（排除 gov_id）
-correlation_matrix = X_train_model.corr()
+# 計算相關性矩陣（排除 gov_id 與類別欄位）
+correlation_matrix = X_train_model.corr(numeric_only=True)
 
 # 建立熱力圖
 plt.figure(figsize=(20, 16))
@@ -354,9 +314,7 @@ print(f"✅ 相關性熱力圖已存檔: {output_model_dir / 'correlation_heatma
 plt.show()
 
 # 儲存相關性矩陣為 CSV
-correlation_matrix.to_csv(
-    output_model_dir / "correlation_matrix.csv", encoding="utf-8-sig"
-)
+save_csv_with_parquet(correlation_matrix, output_model_dir / "correlation_matrix.csv", index=True)
 print(f"✅ 相關性矩陣已存檔: {output_model_dir / 'correlation_matrix.csv'}")
 
 # 找出高度相關的特徵對（|r| > 0.8）
@@ -402,16 +360,19 @@ print(f"   - {output_model_dir / 'model_lightgbm.pkl'}")
 
 
 # === 20. 儲存測試集預測結果 ===
+# 直接取用底層 ndarray，避免 .values 重複產生副本
+y_test_arr = y_test.to_numpy(copy=False)
 results = pd.DataFrame(
     {
-        "gov_id": X_test["gov_id"].values,
-        "actual": y_test.values,
+        "gov_id": X_test["gov_id"].to_numpy(copy=False),
+        "actual": y_test_arr,
         "pred_lgb": y_pred_lgb,
-        "error_lgb": y_test.values - y_pred_lgb,
-    }
+        "error_lgb": y_test_arr - y_pred_lgb,
+    },
+    copy=False,
 )
 
-results.to_csv(output_model_dir / "test_predictions.csv", index=False, encoding="utf-8-sig")
+save_csv_with_parquet(results, output_model_dir / "test_predictions.csv")
 print(f"✅ 測試集預測結果已存檔: {output_model_dir / 'test_predictions.csv'}")
 
 
@@ -440,16 +401,16 @@ print("\n🎉 訓練完成!")
 ```
 data/ML_boxoffice/phase4_models/M2/M2_YYYYMMDD_HHMMSS/
 ├── prepared_data/
-│   ├── preprocessed_full.csv           # 完整預處理資料
-│   ├── preprocessed_features.csv       # 特徵矩陣 (X)
-│   └── preprocessed_target.csv         # 目標變數 (y)
+│   ├── preprocessed_full.csv           # 完整預處理資料（另存 .parquet）
+│   ├── preprocessed_features.csv       # 特徵矩陣 (X)（另存 .parquet）
+│   └── preprocessed_target.csv         # 目標變數 (y)（另存 .parquet）
 ├── training_log_YYYYMMDD_HHMMSS.txt    # 訓練日誌
 ├── feature_importance.csv              # 特徵重要性排名
 ├── prediction_comparison.png           # 預測 vs 實際散佈圖
 ├── correlation_heatmap.png             # 特徵相關性熱力圖
-├── correlation_matrix.csv              # 相關性矩陣
+├── correlation_matrix.csv              # 相關性矩陣（另存 .parquet）
 ├── high_correlation_pairs.csv          # 高相關特徵對（如有）
-├── test_predictions.csv                # 測試集詳細預測結果
+├── test_predictions.csv                # 測試集詳細預測結果（另存 .parquet）
 └── model_lightgbm.pkl                  # 已訓練的 LightGBM 模型
 ```
 
@@ -464,6 +425,7 @@ data/ML_boxoffice/phase4_models/M2/M2_YYYYMMDD_HHMMSS/
   - 排除指定電影
   - 只保留首輪資料
   - 月份週期性編碼
+  - region / publisher 以 category 型別交給 LightGBM 原生類別分裂（不做 OneHot）
   - 移除資料洩漏欄位
 - **評估指標**: MAE, RMSE, R²
 """
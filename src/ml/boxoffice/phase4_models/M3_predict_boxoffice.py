@@ -9,11 +9,12 @@ if str(src_path) not in sys.path:
 
 import pandas as pd
 import numpy as np
-from ml.common.file_utils import ensure_dir
+from ml.common.file_utils import ensure_dir, save_csv_with_parquet
 from io import StringIO
 from datetime import datetime
 from ml.common.path_utils import PHASE3_PREPARE_DIR, PHASE4_MODELS_DIR
-from ml.boxoffice.common.feature_engineering import BoxOfficeFeatureEngineer
+from ml.boxoffice.common.train_preprocess import load_preprocessed_dataset
+from ml.boxoffice.common.tree_predictor import save_tree_arrays
 
 # ===================================================================
 # 全域設定
@@ -45,14 +46,16 @@ class Logger:
     def __init__(self, log_buffer):
         self.terminal = sys.stdout
         self.log = log_buffer
+        # 處理 Windows 終端機編碼問題：啟動時判斷一次終端機編碼，之後每次 write 只需檢查布林值
+        self._encoding = getattr(self.terminal, "encoding", None) or "ascii"
+        self._is_utf = self._encoding.lower().replace("-", "").startswith("utf")
 
     def write(self, message):
-        # 處理 Windows 終端機編碼問題
-        try:
+        if self._is_utf:
             self.terminal.write(message)
-        except UnicodeEncodeError:
+        else:
             # 移除無法編碼的字符
-            clean_message = message.encode("ascii", "ignore").decode("ascii")
+            clean_message = message.encode(self._encoding, "ignore").decode(self._encoding)
             self.terminal.write(clean_message)
         self.log.write(message)
 
@@ -71,58 +74,9 @@ print("=" * 60)
 # ===================================================================
 # 資料預處理
 # ===================================================================
-# === 1. 讀取資料 ===
-df = pd.read_csv(input_data_path)
-
-
-# === 2-1. 排除指定的電影 ===
-# 排除清單路徑
-exclude_config_path = "config/exclude_movies.csv"
-
-try:
-    exclude_df = pd.read_csv(exclude_config_path, comment="#")
-    exclude_gov_ids = exclude_df["gov_id"].dropna().astype(int).tolist()
-
-    if len(exclude_gov_ids) > 0:
-        print(f"\n從 {exclude_config_path} 讀取排除清單:")
-        print(f"  發現 {len(exclude_gov_ids)} 部需要排除的電影")
-        print(f"  排除的 gov_id: {exclude_gov_ids}")
-
-        # 檢查有多少筆資料會被排除
-        exclude_count = df[df["gov_id"].isin(exclude_gov_ids)].shape[0]
-        exclude_movie_count = df[df["gov_id"].isin(exclude_gov_ids)]["gov_id"].nunique()
-        print(f"  將排除 {exclude_movie_count} 部電影，共 {exclude_count} 筆資料")
-
-        # 執行排除
-        df = df[~df["gov_id"].isin(exclude_gov_ids)].copy()
-        print(f"  排除後剩餘資料筆數: {len(df)}")
-    else:
-        print(f"\n{exclude_config_path} 中沒有需要排除的電影")
-
-except FileNotFoundError:
-    print(f"\n警告: 找不到排除清單檔案 {exclude_config_path}，跳過排除步驟")
-except Exception as e:
-    print(f"\n警告: 讀取排除清單時發生錯誤: {e}，跳過排除步驟")
-
-
-# === 2-2. 篩選資料 ===
-# 只保留首輪資料
-df = df[df["round_idx"] == 1].copy()
-# 只保留有活躍週次的資料
-df = df[df["current_week_active_idx"].notna()]
-# 必須同時有 week_1 和 week_2 的資料,且都不為 0
-df = df[
-    (df["boxoffice_week_1"].notna())
-    & (df["boxoffice_week_1"] > 0)
-    & (df["boxoffice_week_2"].notna())
-    & (df["boxoffice_week_2"] > 0)
-]
-print(f"基本篩選後資料筆數: {len(df)}")
-
-
-# === 3. 月份週期性編碼 ===
-# 使用共用特徵工程模組進行編碼
-df = BoxOfficeFeatureEngineer.add_features_to_dataframe(df, group_by_col='gov_id')
+# === 1~3. 讀取資料、排除指定電影、篩選首輪資料、月份週期性編碼 ===
+# M1/M2/M3 共用同一段前處理，輸入檔與排除清單未變動時直接讀取 Parquet 快取
+df = load_preprocessed_dataset(input_data_path)
 
 
 # === 4. 刪除不需要的欄位 ===
@@ -157,11 +111,13 @@ df = df.drop(columns=drop_columns)
 
 # === 5. 檢查缺失值 ===
 print("\n=== 缺失值檢查 ===")
-print(df.isnull().sum()[df.isnull().sum() > 0])
+# 先找出有缺失的欄位，只對這些欄位計數，避免整張表做兩次 isnull().sum()
+missing_cols = df.columns[df.isna().any().to_numpy()]
+print(df[missing_cols].isna().sum())
 
 
 # === 6. 存檔: 完整資料 (含 amount 和 gov_id) ===
-df.to_csv(output_prepare_dir / "preprocessed_full.csv", index=False, encoding="utf-8-sig")
+save_csv_with_parquet(df, output_prepare_dir / "preprocessed_full.csv")
 print(f"\n✅ 已存檔: {output_prepare_dir / 'preprocessed_full.csv'}")
 print("📍資料數量小計:")
 print(f"   欄位數: {len(df.columns)}")
@@ -177,16 +133,12 @@ for i, col in enumerate(df.columns, 1):
 # === 8. 存檔: 訓練用特徵 (移除 amount，保留 gov_id 用於分組) ===
 feature_cols = [col for col in df.columns if col != "amount"]
 df_features = df[feature_cols]
-df_features.to_csv(
-    output_prepare_dir / "preprocessed_features.csv", index=False, encoding="utf-8-sig"
-)
+save_csv_with_parquet(df_features, output_prepare_dir / "preprocessed_features.csv")
 print(f"\n✅ 已存檔: {output_prepare_dir / 'preprocessed_features.csv'}")
 
 
 # === 9. 存檔: 目標變數 ===
-df[["gov_id", "amount"]].to_csv(
-    output_prepare_dir / "preprocessed_target.csv", index=False, encoding="utf-8-sig"
-)
+save_csv_with_parquet(df[["gov_id", "amount"]], output_prepare_dir / "preprocessed_target.csv")
 print(f"✅ 已存檔: {output_prepare_dir / 'preprocessed_target.csv'}")
 
 
@@ -246,13 +198,14 @@ print("\n" + "=" * 50)
 print("🔍 訓練集缺失值檢查")
 print("=" * 50)
 
-missing_train = X_train_model.isnull().sum()
-missing_train = missing_train[missing_train > 0].sort_values(ascending=False)
+missing_cols = X_train_model.columns[X_train_model.isna().any().to_numpy()]
 
-if len(missing_train) > 0:
+if len(missing_cols) > 0:
+    missing_train_df = X_train_model[missing_cols].isna()
+    missing_train = missing_train_df.sum().sort_values(ascending=False)
     print("⚠️ 發現缺失值:")
     print(missing_train)
-    print(f"\n總缺失筆數: {X_train_model.isnull().any(axis=1).sum()}/{len(X_train_model)}")
+    print(f"\n總缺失筆數: {missing_train_df.any(axis=1).sum()}/{len(X_train_model)}")
 else:
     print("✅ 無缺失值")
 
@@ -272,9 +225,14 @@ dt_model = DecisionTreeRegressor(
     random_state=42,
 )
 
-dt_model.fit(X_train_model, y_train)
+# sklearn 的樹模型內部以 float32 比較分裂門檻，先一次轉成 float32 陣列，
+# 避免 fit / predict 各自把 float64 DataFrame 轉型複製（特徵名稱另存於模型檔 tuple 中）
+X_train_f32 = X_train_model.to_numpy(dtype=np.float32)
+X_test_f32 = X_test_model.to_numpy(dtype=np.float32)
+
+dt_model.fit(X_train_f32, y_train)
 
-y_pred_dt = dt_model.predict(X_test_model)
+y_pred_dt = dt_model.predict(X_test_f32)
 
 print(f"MAE:  {mean_absolute_error(y_test, y_pred_dt):,.0f}")
 print(f"RMSE: {np.sqrt(mean_squared_error(y_test, y_pred_dt)):,.0f}")
@@ -289,9 +247,12 @@ print("\n" + "=" * 50)
 print("📊 Top 10 重要特徵 (Decision Tree)")
 print("=" * 50)
 
+# 先用 numpy 取得由大到小的順序，再一次建表（不需事後 sort_values）
+importances = dt_model.feature_importances_
+order = np.argsort(-importances, kind="stable")
 feature_importance = pd.DataFrame(
-    {"feature": X_train_model.columns, "importance": dt_model.feature_importances_}
-).sort_values("importance", ascending=False)
+    {"feature": X_train_model.columns[order], "importance": importances[order]}
+)
 
 print(feature_importance.head(10).to_string(index=False))
 
@@ -353,9 +314,7 @@ print(f"✅ 相關性熱力圖已存檔: {output_model_dir / 'correlation_heatma
 plt.show()
 
 # 儲存相關性矩陣為 CSV
-correlation_matrix.to_csv(
-    output_model_dir / "correlation_matrix.csv", encoding="utf-8-sig"
-)
+save_csv_with_parquet(correlation_matrix, output_model_dir / "correlation_matrix.csv", index=True)
 print(f"✅ 相關性矩陣已存檔: {output_model_dir / 'correlation_matrix.csv'}")
 
 # 找出高度相關的特徵對（|r| > 0.8）
@@ -396,21 +355,29 @@ else:
 import joblib
 
 joblib.dump((dt_model, X_train_model.columns.tolist()), output_model_dir / "model_decision_tree.pkl")
+
+# 匯出樹結構陣列，部署時可用 tree_predictor.predict_tree_arrays 批次預測
+save_tree_arrays(dt_model, output_model_dir / "model_decision_tree_arrays.npz")
+
 print(f"\n✅ 模型已存檔:")
 print(f"   - {output_model_dir / 'model_decision_tree.pkl'}")
+print(f"   - {output_model_dir / 'model_decision_tree_arrays.npz'}")
 
 
 # === 20. 儲存測試集預測結果 ===
+# 直接取用底層 ndarray，避免 .values 重複產生副本
+y_test_arr = y_test.to_numpy(copy=False)
 results = pd.DataFrame(
     {
-        "gov_id": X_test["gov_id"].values,
-        "actual": y_test.values,
+        "gov_id": X_test["gov_id"].to_numpy(copy=False),
+        "actual": y_test_arr,
         "pred_dt": y_pred_dt,
-        "error_dt": y_test.values - y_pred_dt,
-    }
+        "error_dt": y_test_arr - y_pred_dt,
+    },
+    copy=False,
 )
 
-results.to_csv(output_model_dir / "test_predictions.csv", index=False, encoding="utf-8-sig")
+save_csv_with_parquet(results, output_model_dir / "test_predictions.csv")
 print(f"✅ 測試集預測結果已存檔: {output_model_dir / 'test_predictions.csv'}")
 
 
@@ -439,17 +406,18 @@ print("\n🎉 訓練完成!")
 ```
 data/ML_boxoffice/phase4_models/M3/M3_YYYYMMDD_HHMMSS/
 ├── prepared_data/
-│   ├── preprocessed_full.csv           # 完整預處理資料
-│   ├── preprocessed_features.csv       # 特徵矩陣 (X)
-│   └── preprocessed_target.csv         # 目標變數 (y)
+│   ├── preprocessed_full.csv           # 完整預處理資料（另存 .parquet）
+│   ├── preprocessed_features.csv       # 特徵矩陣 (X)（另存 .parquet）
+│   └── preprocessed_target.csv         # 目標變數 (y)（另存 .parquet）
 ├── training_log_YYYYMMDD_HHMMSS.txt    # 訓練日誌
 ├── feature_importance.csv              # 特徵重要性排名
 ├── prediction_comparison.png           # 預測 vs 實際散佈圖
 ├── correlation_heatmap.png             # 特徵相關性熱力圖
-├── correlation_matrix.csv              # 相關性矩陣
+├── correlation_matrix.csv              # 相關性矩陣（另存 .parquet）
 ├── high_correlation_pairs.csv          # 高相關特徵對（如有）
-├── test_predictions.csv                # 測試集詳細預測結果
-└── model_decision_tree.pkl             # 已訓練的 Decision Tree 模型
+├── test_predictions.csv                # 測試集詳細預測結果（另存 .parquet）
+├── model_decision_tree.pkl             # 已訓練的 Decision Tree 模型
+└── model_decision_tree_arrays.npz      # 決策樹結構陣列（部署用）
 ```
 
 ## 🔍 M3 模型說明
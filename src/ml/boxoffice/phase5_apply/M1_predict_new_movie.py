@@ -3,17 +3,17 @@ M1 新電影預測模組
 說明: 提供新電影票房預測功能，可用於 API 或命令列介面
 """
 
-import joblib
-import pandas as pd
 from pathlib import Path
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import sys
+import warnings
 
 # 加入共用模組路徑
 sys.path.append(str(Path(__file__).parent.parent.parent.parent))
 from ml.boxoffice.common.feature_engineering import BoxOfficeFeatureEngineer
+from ml.boxoffice.common.model_loader import load_model_cached
 
 
 class M1NewMoviePredictor:
@@ -47,7 +47,9 @@ class M1NewMoviePredictor:
             return  # 已經載入過了
 
         try:
-            self.model, self.feature_names = joblib.load(self.model_path)
+            self.model, feature_names = load_model_cached(str(self.model_path))
+            self.feature_names = tuple(feature_names)
+
             self.model_loaded = True
             print(f"[OK] 已載入模型: {self.model_path}")
         except Exception as e:
@@ -78,14 +80,15 @@ class M1NewMoviePredictor:
             movie_data["release_month_sin"] = sin_val
             movie_data["release_month_cos"] = cos_val
 
-        # 建立 DataFrame
-        X_new = pd.DataFrame([movie_data])
-
-        # 使用模型內建的欄位順序
-        X_new = X_new[self.feature_names]
+        # 依模型內建的欄位順序建立 (1, n) 陣列（缺少欄位時與原本 DataFrame 取欄一樣拋出 KeyError）；
+        # 每次呼叫各自建立，API 多執行緒共用同一個預測器時才不會互相覆寫
+        row = np.array([[movie_data[name] for name in self.feature_names]], dtype=np.float64)
 
-        # 預測
-        prediction = self.model.predict(X_new)[0]
+        # 預測（模型以 DataFrame 訓練，ndarray 輸入時 sklearn 會發出欄位名稱警告；
+        # 欄位順序已由 feature_names 保證，只在這次呼叫內忽略該警告）
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message="X does not have valid feature names")
+            prediction = float(self.model.predict(row)[0])
 
         return prediction
 
@@ -121,35 +124,23 @@ class M1NewMoviePredictor:
             if week_data[-2].get('boxoffice', 0) <= 0:
                 raise ValueError("第二近的一週票房必須大於 0（對應訓練資料的 boxoffice_week_2 > 0 條件）")
 
-        # 使用共用模組解析上映日期
-        release_date = BoxOfficeFeatureEngineer.parse_release_date(movie_info.get('release_date'))
-
-        # 使用共用模組計算首週實力指標
-        opening_strength = BoxOfficeFeatureEngineer.calculate_opening_strength(week_data, release_date)
-
         # 預測結果
         predictions = []
         current_week_idx = len(week_data)
 
+        # 第 2 週起的 Lag Features 取自前一週的預測值，各週必須依序預測，無法合併成單次 model.predict；
+        # 每次呼叫 predict_single_week 已走 ndarray 快速路徑
         for i in range(predict_weeks):
             # 準備特徵資料
             target_week = current_week_idx + i + 1
 
-            # 使用共用模組計算 Lag Features
-            lag_features = BoxOfficeFeatureEngineer.calculate_lag_features(
-                week_data=week_data,
-                target_week=target_week,
-                use_predictions=(i > 0),  # 第一次預測不使用，之後使用
-                predictions=predictions if i > 0 else None
-            )
-
             print("before特徵工程",week_data,movie_info,target_week,i)
             # 使用共用模組建立完整特徵字典
             features = BoxOfficeFeatureEngineer.build_prediction_features(
                 week_data=week_data,
                 movie_info=movie_info,
                 target_week=target_week,
-                use_predictions=(i > 0),
+                use_predictions=(i > 0),  # 第一次預測不使用，之後使用
                 predictions=predictions if i > 0 else None
             )
             print('after特徵工程- 準備餵給模型的預測資料:', features)
@@ -163,13 +154,13 @@ class M1NewMoviePredictor:
             # 估算其他數值（觀影人數、院線數）
             predicted_audience = int(predicted_boxoffice / 300)  # 假設平均票價 300 元
 
-            # 取得前一週的院線數
-            prev_screens = lag_features.get('screens_week_1', 100)
+            # 取得前一週的院線數（Lag Features 已包含在特徵字典中，不必再重算）
+            prev_screens = features.get('screens_week_1', 100)
             predicted_screens = max(int(prev_screens * 0.9), 20)  # 院線數衰退 10%
             # ==================================================
 
             # 計算衰退率
-            prev_boxoffice = lag_features.get('boxoffice_week_1', 0)
+            prev_boxoffice = features.get('boxoffice_week_1', 0)
             decline_rate = (predicted_boxoffice - prev_boxoffice) / prev_boxoffice if prev_boxoffice > 0 else 0
 
             predictions.append({
@@ -5,6 +5,7 @@
 
 from datetime import datetime, timedelta, date
 import re
+import time
 
 # ========= 全域設定 =========
 TODAY_DATETIME = datetime.today()
@@ -169,3 +170,21 @@ def create_timestamped() -> str:
     可用於檔案命名，例如：boxoffice_20251010.json"""
     now = datetime.now()
     return f"{now.strftime('%Y%m%d')}"
+
+
+# 同一秒內重複呼叫時沿用已格式化的字串：(epoch 秒, 格式化結果)
+_now_str_cache = (0, "")
+
+
+def now_str() -> str:
+    """
+    回傳目前時間字串（YYYY-MM-DD HH:MM:SS），等同 datetime.now().strftime(...)
+
+    爬蟲每筆成功／錯誤紀錄都會寫入時間；同一秒內的呼叫直接回傳快取，
+    只在秒數改變時才重新 strftime
+    """
+    global _now_str_cache
+    second = int(time.time())
+    if second != _now_str_cache[0]:
+        _now_str_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    return _now_str_cache[1]
@@ -8,11 +8,15 @@
 """
 
 import os
-import json
+import csv
+import orjson
 import pandas as pd
 from datetime import datetime
 import re
 
+# orjson 輸出格式：縮排 2 格（與原 json.dump(indent=2) 相同）、允許非字串 key
+JSON_DUMP_OPTION = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
 
 # --------------------------------------------------------
 # 檔案、資料夾相關
@@ -23,10 +27,14 @@ def ensure_dir(path: str) -> None:
     os.makedirs(path, exist_ok=True)
 
 
+# 檔名不合法字元（模組載入時編譯一次）
+INVALID_FILENAME_RE = re.compile(r'[\\/*?:"<>|]')
+
+
 # 移除檔名中不合法字元
 def clean_filename(name: str) -> str:
     """移除檔名中不合法字元"""
-    return re.sub(r'[\\/*?:"<>|]', "_", name)
+    return INVALID_FILENAME_RE.sub("_", name)
 
 
 # --------------------------------------------------------
@@ -35,15 +43,34 @@ def clean_filename(name: str) -> str:
 # 儲存 JSON 檔
 def save_json(data: dict, dir_path: str, filename: str, topic: str = "") -> str:
     """儲存 JSON 檔，回傳實際儲存路徑。"""
-    ensure_dir(dir_path)
-    file_path = os.path.join(dir_path, filename)
-    try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"✅ 已儲存 JSON{topic}：{file_path}")
-    except Exception as e:
-        print(f"❌ 儲存 JSON 失敗：{file_path}\n{e}")
-    return file_path
+    return save_json_copies(data, [(dir_path, filename)], topic)[0]
+
+
+# 同一份資料存成多個 JSON 檔
+def save_json_copies(data: dict, targets: list, topic: str = "") -> list:
+    """
+    同一份資料存成多個 JSON 檔（例如週次資料夾 + full 資料夾），回傳實際儲存路徑清單。
+    只序列化一次，再把同一份 bytes 寫入各個路徑。
+
+    Args:
+        targets: [(dir_path, filename), ...]
+    """
+    file_paths = []
+    payload = None
+    for dir_path, filename in targets:
+        ensure_dir(dir_path)
+        file_path = os.path.join(dir_path, filename)
+        file_paths.append(file_path)
+        try:
+            # orjson 一次序列化為 UTF-8 bytes（中文不跳脫），單次 write 寫入
+            if payload is None:
+                payload = orjson.dumps(data, option=JSON_DUMP_OPTION)
+            with open(file_path, "wb") as f:
+                f.write(payload)
+            print(f"✅ 已儲存 JSON{topic}：{file_path}")
+        except Exception as e:
+            print(f"❌ 儲存 JSON 失敗：{file_path}\n{e}")
+    return file_paths
 
 
 # 讀取 JSON 檔
@@ -52,8 +79,8 @@ def load_json(file_path: str) -> dict:
     if not os.path.exists(file_path):
         print(f"⚠️ 找不到檔案：{file_path}")
         return {}
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(file_path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 # --------------------------------------------------------
@@ -71,19 +98,49 @@ def save_csv(df: pd.DataFrame, dir_path: str, filename: str) -> str:
     return file_path
 
 
+def save_csv_rows(rows: list, dir_path: str, filename: str) -> str:
+    """
+    將 dict 列直接以 csv 模組寫成 CSV，回傳實際儲存路徑。
+    輸出格式與 save_csv 相同（BOM、表頭取第一列的 key），適合只有一兩列的小檔案，不需先建立 DataFrame。
+    """
+    ensure_dir(dir_path)
+    file_path = os.path.join(dir_path, filename)
+    try:
+        with open(file_path, "w", encoding="utf-8-sig", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()), lineterminator=os.linesep)
+            writer.writeheader()
+            writer.writerows(rows)
+        print(f"✅ 已儲存 CSV：{file_path}")
+    except Exception as e:
+        print(f"❌ 儲存 CSV 失敗：{file_path}\n{e}")
+    return file_path
+
+
+def save_csv_with_parquet(df: pd.DataFrame, file_path, index: bool = False) -> str:
+    """儲存 CSV 並在同路徑另存一份 .parquet（保留欄位型別，供程式讀取），回傳 CSV 路徑。"""
+    file_path = str(file_path)
+    df.to_csv(file_path, index=index, encoding="utf-8-sig")
+    parquet_path = os.path.splitext(file_path)[0] + ".parquet"
+    df.to_parquet(parquet_path, engine="pyarrow", compression="zstd", index=index)
+    return file_path
+
+
 def list_files(dir_path: str, ext: str = "json") -> list:
-    """列出指定資料夾內的特定副檔名檔案（預設 json）。"""
+    """列出指定資料夾內的特定副檔名檔案（預設 json，不含子資料夾）。"""
     if not os.path.exists(dir_path):
         return []
-    return [f for f in os.listdir(dir_path) if f.endswith(f".{ext}")]
+    # scandir 的 is_file() 直接取用目錄項目型別，不需每個檔案再 stat 一次
+    with os.scandir(dir_path) as entries:
+        return [e.name for e in entries if e.is_file() and e.name.endswith(f".{ext}")]
 
 
 def get_latest_file(dir_path: str, ext: str = "json") -> str | None:
     """取得資料夾內最新的檔案（依修改時間排序）。"""
     if not os.path.exists(dir_path):
         return None
-    files = [os.path.join(dir_path, f) for f in os.listdir(dir_path) if f.endswith(f".{ext}")]
-    return max(files, key=os.path.getmtime) if files else None
+    with os.scandir(dir_path) as entries:
+        files = [e for e in entries if e.is_file() and e.name.endswith(f".{ext}")]
+    return max(files, key=lambda e: e.stat().st_mtime).path if files else None
 
 
 # --------------------------------------------------------
@@ -11,9 +11,10 @@ mapping_utils.py
 """
 
 import os
-import json
+import orjson
 from typing import Optional
 from ml.common.path_utils import MANUAL_FIX_DIR
+from ml.common.file_utils import JSON_DUMP_OPTION
 
 
 # ==============================
@@ -34,8 +35,8 @@ def load_manual_mapping() -> list[dict]:
     ensure_mapping_dir()
     if not os.path.exists(FIX_MAPPING_FILE):
         return {}
-    with open(FIX_MAPPING_FILE, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(FIX_MAPPING_FILE, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def load_manual_mapping_as_dict() -> dict:
@@ -47,8 +48,8 @@ def load_manual_mapping_as_dict() -> dict:
 def save_manual_mapping(data: list[dict]):
     """儲存人工修正對照表（陣列形式）"""
     ensure_mapping_dir()
-    with open(FIX_MAPPING_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open(FIX_MAPPING_FILE, "wb") as f:
+        f.write(orjson.dumps(data, option=JSON_DUMP_OPTION))
     print(f"💾 已更新人工修正對照表：{FIX_MAPPING_FILE}")
 
 
@@ -1,6 +1,17 @@
 ###################################################
 #  表頭相關設定(requests/headers/session/timeout)
 ###################################################
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # -------------------------------
@@ -18,3 +29,212 @@ def get_default_headers() -> dict:
         "Accept-Language": "zh-TW,zh;q=0.9,en;q=0.8",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
+
+
+# -------------------------------
+# 同步 Session（keep-alive 連線池 + 自動重試）
+# -------------------------------
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def create_session(
+    retries: int = 5,
+    backoff_factor: float = 0.3,
+    pool_maxsize: int = 10,
+    status_forcelist: tuple = RETRY_STATUS_CODES,
+    session: Optional[requests.Session] = None,
+    headers: Optional[Mapping[str, str]] = None,
+) -> requests.Session:
+    """
+    建立（或設定既有的）requests.Session
+
+    - 同一 Session 重複使用 TCP/TLS 連線，不必每次請求重新握手
+    - 連線錯誤與 status_forcelist 中的狀態碼以指數退避自動重試（會參考 Retry-After），
+      重試用盡時回傳最後一次回應，由呼叫端自行判斷
+    - 沿用 Session 上既有的 adapter（例如 cloudscraper 帶 TLS 設定的 CipherSuiteAdapter），
+      只調整重試與連線池大小
+
+    Args:
+        retries: 最多重試次數
+        backoff_factor: 退避係數（第 n 次重試前等待 backoff_factor * 2^(n-1) 秒）
+        pool_maxsize: 每個主機保留的連線數
+        status_forcelist: 需要重試的 HTTP 狀態碼
+        session: 既有的 Session（例如 cloudscraper），未提供時新建
+        headers: 設為 Session 預設標頭（每次請求不必再傳入、合併）
+
+    Returns:
+        已設定重試與連線池的 Session
+    """
+    session = session or requests.Session()
+    if headers:
+        session.headers.update(headers)
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=status_forcelist,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    for prefix in ("https://", "http://"):
+        adapter = session.adapters.get(prefix)
+        if not isinstance(adapter, HTTPAdapter):
+            adapter = HTTPAdapter()
+            session.mount(prefix, adapter)
+        adapter.max_retries = retry
+        adapter.init_poolmanager(pool_maxsize, pool_maxsize)
+    return session
+
+
+# -------------------------------
+# 同步限流器（滑動視窗 RPM，執行緒安全）
+# -------------------------------
+class RateLimiter:
+    """
+    同步請求限流器：任意 window 秒內最多放行 rpm 個請求
+
+    額度未用完時 acquire() 立即返回，不像固定 sleep 每次都等待；
+    多個執行緒共用同一個實例時，總速率仍不超過 rpm
+
+    用法：
+        limiter.acquire()
+        ... 發出請求 ...
+    """
+
+    def __init__(self, rpm: int, window: float = 60.0):
+        self.rpm = rpm
+        self.window = window
+        self._timestamps = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """取得滑動視窗額度，必要時等待"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._timestamps and self._timestamps[0] <= now - self.window:
+                    self._timestamps.popleft()
+
+                if len(self._timestamps) < self.rpm:
+                    self._timestamps.append(now)
+                    return
+                wait = self._timestamps[0] + self.window - now
+            time.sleep(wait)
+
+
+# -------------------------------
+# 非同步限流器（滑動視窗 RPM + AIMD 併發調整）
+# -------------------------------
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """解析 Retry-After 標頭（秒數或 HTTP 日期），無法解析時回傳 None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """指數退避等待秒數：base * 2^attempt（上限 cap）再加 0~1 秒隨機抖動"""
+    return min(cap, base * (2**attempt)) + random.uniform(0, 1)
+
+
+class AsyncRateLimiter:
+    """
+    非同步請求限流器
+
+    - 滑動視窗：任意 window 秒內最多發出 rpm 個請求
+    - AIMD：遇到 429/5xx 或 Retry-After 時併發上限減半，
+      連續 increase_after 次成功後併發上限 +1（不超過 max_concurrency）
+    - 回應帶有 X-RateLimit-Remaining / X-RateLimit-Limit 且剩餘額度低於 10% 時，
+      主動暫停一個視窗
+
+    用法：
+        await limiter.acquire()
+        try:
+            ... 發出請求 ...
+            limiter.on_response(status, headers)
+        finally:
+            await limiter.release()
+    """
+
+    def __init__(
+        self,
+        rpm: int,
+        max_concurrency: int,
+        window: float = 60.0,
+        increase_after: int = 10,
+    ):
+        self.rpm = rpm
+        self.window = window
+        self.max_concurrency = max_concurrency
+        self.concurrency = max_concurrency
+        self.increase_after = increase_after
+        self._timestamps = deque()
+        self._in_flight = 0
+        self._success_streak = 0
+        self._paused_until = 0.0
+        self._cond = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        """取得併發槽位與滑動視窗額度，必要時等待"""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self.concurrency)
+            self._in_flight += 1
+
+        try:
+            while True:
+                now = time.monotonic()
+                while self._timestamps and self._timestamps[0] <= now - self.window:
+                    self._timestamps.popleft()
+
+                wait = self._paused_until - now
+                if len(self._timestamps) >= self.rpm:
+                    wait = max(wait, self._timestamps[0] + self.window - now)
+                if wait <= 0:
+                    self._timestamps.append(now)
+                    return
+                await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            # 等待視窗額度時被取消（Ctrl-C、asyncio.run 取消剩餘工作）：呼叫端還沒進入 try/finally，
+            # 在此歸還併發槽位，避免槽位永久佔用
+            await self.release()
+            raise
+
+    async def release(self) -> None:
+        """歸還併發槽位"""
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_response(self, status: int, headers: Mapping[str, str]) -> None:
+        """依回應狀態碼與標頭調整併發上限與暫停時間"""
+        now = time.monotonic()
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+
+        if status == 429 or status >= 500 or retry_after is not None:
+            self.concurrency = max(1, self.concurrency // 2)
+            self._success_streak = 0
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            return
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        limit = headers.get("X-RateLimit-Limit")
+        if remaining is not None and limit:
+            try:
+                if int(remaining) < int(limit) * 0.1:
+                    self._paused_until = max(self._paused_until, now + self.window)
+            except ValueError:
+                pass
+
+        self._success_streak += 1
+        if self._success_streak >= self.increase_after:
+            self._success_streak = 0
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1)
@@ -49,6 +49,7 @@ BOXOFFICE_PROCESSED = os.path.join(PROCESSED_DIR, "boxoffice_weekly")
 BOXOFFICE_PERMOVIE_RAW = os.path.join(RAW_DIR, "boxoffice_permovie")
 BOXOFFICE_PERMOVIE_FULL = os.path.join(BOXOFFICE_PERMOVIE_RAW, "full")  # 完整資料（不含週次標籤，自動覆蓋）
 BOXOFFICE_PERMOVIE_PROCESSED = os.path.join(PROCESSED_DIR, "boxoffice_permovie")
+BOXOFFICE_PERMOVIE_CACHE_DIR = os.path.join(BOXOFFICE_PERMOVIE_RAW, "response_cache")  # 詳細頁回應快取（diskcache / SQLite）
 
 # 政府公開電影資料（單一電影）
 MOVIEINFO_GOV_PROCESSED = os.path.join(PROCESSED_DIR, "movieInfo_gov")
@@ -56,6 +57,8 @@ MOVIEINFO_GOV_COMBINED_PROCESSED = os.path.join(MOVIEINFO_GOV_PROCESSED, "combin
 
 # OMDb　電影資訊
 OMDB_RAW = os.path.join(RAW_DIR, "omdb")
+OMDB_CACHE_DIR = os.path.join(OMDB_RAW, "cache")  # gov_id → imdb_id 對照快取（diskcache / SQLite）
+OMDB_RESPONSE_CACHE_DIR = os.path.join(OMDB_RAW, "response_cache")  # OMDb 回應快取（diskcache / SQLite）
 RATING_OMDB_PROCESSED = os.path.join(PROCESSED_DIR, "rating_omdb")
 
 # ----------------- ML_recommend 專屬OUTPUT -----------------
@@ -18,22 +18,25 @@
 # ========= 套件匯入 =========
 import os
 import argparse
-import time
 import requests
+import orjson
 import pandas as pd
 import cloudscraper  
+from diskcache import Cache
 from pathlib import Path
 from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # 共用模組
 from ml.common.path_utils import (
     BOXOFFICE_PERMOVIE_RAW,
     BOXOFFICE_PERMOVIE_FULL,
     BOXOFFICE_PROCESSED,
+    BOXOFFICE_PERMOVIE_CACHE_DIR,
 )
-from ml.common.network_utils import get_default_headers
-from ml.common.file_utils import ensure_dir, save_json, clean_filename
-from ml.common.date_utils import get_week_label, get_year_label, get_last_week_range
+from ml.common.network_utils import get_default_headers, create_session, RateLimiter
+from ml.common.file_utils import ensure_dir, save_json_copies, INVALID_FILENAME_RE
+from ml.common.date_utils import get_week_label, get_year_label, get_last_week_range, now_str
 
 
 # ========= 全域設定 =========
@@ -41,17 +44,36 @@ SEARCH_URL = "https://boxofficetw.tfai.org.tw/film/sf?keyword="
 DETAIL_URL = "https://boxofficetw.tfai.org.tw/film/gfd/"
 HEADERS = get_default_headers()
 TIMEOUT = 10
-SLEEP_INTERVAL = 1.2  # 避免連續請求過快被限制
-SCRAPER = cloudscraper.create_scraper() 
+MAX_WORKERS = 4  # 同時查詢的電影數（cloudscraper 為同步 session，以執行緒併發）
+BOXOFFICE_RPM = 50  # 每 60 秒最多發出的詳細頁請求數（所有執行緒合計，約為原本每 1.2 秒一筆的速率）
+RATE_LIMITER = RateLimiter(rpm=BOXOFFICE_RPM)
+# 共用 keep-alive 連線池（大小對齊併發數）；429/5xx 自動退避重試。
+# 503 不重試：Cloudflare 驗證頁以 503 回應，需交給 cloudscraper 處理
+SCRAPER = create_session(
+    retries=3,
+    backoff_factor=0.5,
+    pool_maxsize=MAX_WORKERS,
+    status_forcelist=(429, 500, 502, 504),
+    session=cloudscraper.create_scraper(),
+    headers=HEADERS,
+)
+RESPONSE_CACHE_TTL = 24 * 60 * 60  # 詳細頁回應快取有效秒數（票房每週更新，只讓同日重跑沿用）
+RESPONSE_CACHE = Cache(BOXOFFICE_PERMOVIE_CACHE_DIR, timeout=60)  # film_id → 回應 JSON
 
 # ========= 輔助函式 =========
 # 抓票房資料
 def fetch_boxoffice_data(film_id: str) -> dict | None:
-    """根據電影 ID 抓取票房統計資料"""
+    """根據電影 ID 抓取票房統計資料（快取有效期限內直接回傳快取，不打 API）"""
+    cached = RESPONSE_CACHE.get(film_id)
+    if cached is not None:
+        return cached
+
     try:
-        res = SCRAPER.get(DETAIL_URL + film_id, headers=HEADERS, timeout=TIMEOUT)  
-        res.encoding = "utf-8"
-        data = res.json()
+        RATE_LIMITER.acquire()
+        res = SCRAPER.get(DETAIL_URL + film_id, timeout=TIMEOUT)
+        data = orjson.loads(res.content)
+        if isinstance(data, dict) and data.get("data"):
+            RESPONSE_CACHE.set(film_id, data, expire=RESPONSE_CACHE_TTL)
         return data
     except Exception as e:
         print(f"❌ 票房資料抓取失敗：ID={film_id} ({e})")
@@ -59,10 +81,19 @@ def fetch_boxoffice_data(film_id: str) -> dict | None:
 
 
 # ========= 主爬蟲邏輯 =========
-def fetch_boxoffice_permovie_from_weekly(reference_date: date | None = None) -> None:
+def fetch_boxoffice_permovie_from_weekly(
+    reference_date: date | None = None, refresh: bool = False
+) -> None:
     """
     以每週票房名單為基準，逐一抓取單部電影的票房統計資料。
+
+    Args:
+        reference_date: 參考日期（抓取其上一週名單），預設為當天
+        refresh: 先清除詳細頁回應快取，強制重新查詢
     """
+    if refresh:
+        RESPONSE_CACHE.clear()
+        print("🧹 已清除票房詳細頁回應快取")
 
     # 設定查詢日期
     last_week_date_range = get_last_week_range(reference_date)
@@ -94,7 +125,8 @@ def fetch_boxoffice_permovie_from_weekly(reference_date: date | None = None) ->
     print(f"本周票房檔案：{boxoffice_this_week_filePath}")
 
     # 讀取檔案
-    df_weekly = pd.read_csv(boxoffice_this_week_filePath)
+    # movieId 以字串讀入：欄位有缺值時不會被轉成 float（避免 "12345.0"）
+    df_weekly = pd.read_csv(boxoffice_this_week_filePath, dtype={"movieId": "string"})
 
     if "movieId" not in df_weekly.columns:
         print("❌ 檔案缺少必要欄位 'movieId'")
@@ -113,36 +145,41 @@ def fetch_boxoffice_permovie_from_weekly(reference_date: date | None = None) ->
     ensure_dir(BOXOFFICE_PERMOVIE_FULL)
 
     # ------------------------------------------------
-    # 開始逐部電影抓取
+    # 開始併發抓取
     # ------------------------------------------------
-    for _, row in df_weekly.iterrows():
-        movie_id = str(row["movieId"]).strip()
-        movie_name = row.get("name", "")
-        clean_movie_name = clean_filename(movie_name)
-
-        if not movie_id or movie_id == "nan":
-            print(f"⚠️ 無有效 movieId，略過：{movie_name}")
-            continue
-
-        # 抓取單部電影資料
-        crawler_data = fetch_boxoffice_data(movie_id)
-
-        # 加入最新爬取日期
-        if crawler_data:
-            crawler_data["last_crawled_date"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        # 1. 儲存到週次資料夾（含週次標籤）
-        file_name_with_week = f"{movie_id}_{clean_movie_name}_{WEEK_LABEL}.json"
-        save_json(crawler_data, output_dir, file_name_with_week)
-
-        # 2. 額外儲存到 full 資料夾（不含週次標籤，會自動覆蓋舊資料）
-        file_name_full = f"{movie_id}_{clean_movie_name}.json"
-        save_json(crawler_data, BOXOFFICE_PERMOVIE_FULL, file_name_full)
-
-        print(f"✅ 已儲存：{file_name_with_week} (週次) & {file_name_full} (full)")
-        success_crawler_num += 1
-
-        time.sleep(SLEEP_INTERVAL)
+    # 整欄一次判斷有效 movieId（缺少 name 欄或片名缺值時補空字串）
+    movie_ids = df_weekly["movieId"].str.strip()
+    movie_names = df_weekly.reindex(columns=["name"])["name"].fillna("").astype(str)
+    valid_mask = movie_ids.notna() & movie_ids.ne("")
+
+    for movie_name in movie_names[~valid_mask]:
+        print(f"⚠️ 無有效 movieId，略過：{movie_name}")
+
+    # 整欄一次替換檔名不合法字元（同 clean_filename）
+    clean_names = movie_names[valid_mask].str.replace(INVALID_FILENAME_RE, "_", regex=True)
+    movies = list(zip(movie_ids[valid_mask].tolist(), clean_names.tolist()))
+
+    # 以執行緒池同時送出 MAX_WORKERS 個請求，結果依名單順序取回後在主執行緒存檔
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        results = executor.map(fetch_boxoffice_data, [movie_id for movie_id, _ in movies])
+
+        for (movie_id, clean_movie_name), crawler_data in zip(movies, results):
+            # 加入最新爬取日期
+            if crawler_data:
+                crawler_data["last_crawled_date"] = now_str()
+
+            # 1. 儲存到週次資料夾（含週次標籤）
+            # 2. 額外儲存到 full 資料夾（不含週次標籤，會自動覆蓋舊資料）
+            # 兩份內容相同，只序列化一次
+            file_name_with_week = f"{movie_id}_{clean_movie_name}_{WEEK_LABEL}.json"
+            file_name_full = f"{movie_id}_{clean_movie_name}.json"
+            save_json_copies(
+                crawler_data,
+                [(output_dir, file_name_with_week), (BOXOFFICE_PERMOVIE_FULL, file_name_full)],
+            )
+
+            print(f"✅ 已儲存：{file_name_with_week} (週次) & {file_name_full} (full)")
+            success_crawler_num += 1
 
     # ------------------------------------------------
     # 統計輸出
@@ -165,6 +202,11 @@ if __name__ == "__main__":
         type=str,
         help="指定參考日期（格式：YYYY-MM-DD），預設為當天",
     )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="清除詳細頁回應快取後重新查詢（預設沿用 24 小時內的快取）",
+    )
 
     args = parser.parse_args()
 
@@ -177,4 +219,4 @@ if __name__ == "__main__":
             print("❌ 日期格式錯誤，請使用 YYYY-MM-DD 格式")
             exit(1)
 
-    fetch_boxoffice_permovie_from_weekly(reference_date)
+    fetch_boxoffice_permovie_from_weekly(reference_date, refresh=args.refresh)
@@ -6,6 +6,7 @@
 import os
 import argparse
 import cloudscraper
+import orjson
 import time
 from ml.common.date_utils import (
     get_last_week_range,
@@ -14,18 +15,42 @@ from ml.common.date_utils import (
     get_year_label,
 )
 from ml.common.path_utils import BOXOFFICE_RAW
+from ml.common.network_utils import create_session
 from ml.common.file_utils import save_json
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 # 全國電影票房統計API- 每周電影票房
 BASE_URL = "https://boxofficetw.tfai.org.tw/stat/qsl"
 
 
+##### 建立 scraper #####
+def create_boxoffice_scraper(pool_maxsize: int = 1):
+    """使用 cloudscraper 來繞過 Cloudflare 保護（429/5xx 自動退避重試，503 留給 cloudscraper 處理驗證頁）"""
+    return create_session(
+        retries=3,
+        backoff_factor=0.5,
+        pool_maxsize=pool_maxsize,
+        status_forcelist=(429, 500, 502, 504),
+        session=cloudscraper.create_scraper(
+            browser={
+                'browser': 'chrome',
+                'platform': 'windows',
+                'desktop': True
+            }
+        ),
+    )
+
+
 ##### 取得<每周電影票房>票房 #####
-def fetch_boxoffice_json(reference_date: date | None = None):
+def fetch_boxoffice_json(reference_date: date | None = None, scraper=None):
     """
     從官方 API 下載指定週的票房資料(JSON) 並存檔
+
+    Args:
+        reference_date: 參考日期（抓取其上一週），預設為當天
+        scraper: 共用的 scraper（多週回補時傳入），未提供時新建
     """
 
     # 設定查詢日期
@@ -45,14 +70,7 @@ def fetch_boxoffice_json(reference_date: date | None = None):
         "region": "all",
     }
 
-    # 使用 cloudscraper 來繞過 Cloudflare 保護
-    scraper = cloudscraper.create_scraper(
-        browser={
-            'browser': 'chrome',
-            'platform': 'windows',
-            'desktop': True
-        }
-    )
+    scraper = scraper or create_boxoffice_scraper()
 
     print("正在取得票房資料...")
 
@@ -62,7 +80,7 @@ def fetch_boxoffice_json(reference_date: date | None = None):
 
     # 檢查回應是否為 JSON
     try:
-        data = response.json()
+        data = orjson.loads(response.content)
     except Exception as e:
         print(f"\n[ERROR] API 回應不是有效的 JSON")
         print(f"狀態碼: {response.status_code}")
@@ -88,6 +106,37 @@ def fetch_boxoffice_json(reference_date: date | None = None):
     print("\n==============================")
 
 
+##### 回補多週<每周電影票房> #####
+def fetch_boxoffice_json_batch(reference_dates: list[date], max_workers: int = 4):
+    """
+    回補多週票房資料：各週查詢互不相關，共用同一個 scraper（連線池）以執行緒同時送出
+
+    Args:
+        reference_dates: 參考日期清單（每個日期抓取其上一週）
+        max_workers: 同時查詢的週數
+    """
+    scraper = create_boxoffice_scraper(pool_maxsize=max_workers)
+    failed_dates = []
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch_boxoffice_json, reference_date, scraper): reference_date
+            for reference_date in reference_dates
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failed_dates.append(futures[future])
+                print(f"❌ 參考日期 {futures[future]} 的票房資料抓取失敗：{e}")
+
+    print("\n==============================")
+    print(f"🎉 多週票房資料回補完成：成功 {len(reference_dates) - len(failed_dates)} 週")
+    if failed_dates:
+        print(f"⚠️ 失敗的參考日期：{', '.join(str(d) for d in sorted(failed_dates))}")
+    print("==============================")
+
+
 # 主程式
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="抓取每周電影票房資料")
@@ -96,6 +145,12 @@ if __name__ == "__main__":
         type=str,
         help="指定參考日期（格式：YYYY-MM-DD），預設為當天",
     )
+    parser.add_argument(
+        "--weeks",
+        type=int,
+        default=1,
+        help="回補週數：從參考日期往前共抓幾週（預設 1，只抓最近一週）",
+    )
 
     args = parser.parse_args()
 
@@ -108,7 +163,11 @@ if __name__ == "__main__":
             print("❌ 日期格式錯誤，請使用 YYYY-MM-DD 格式")
             exit(1)
 
-    fetch_boxoffice_json(reference_date)
+    if args.weeks > 1:
+        base_date = reference_date or date.today()
+        fetch_boxoffice_json_batch([base_date - timedelta(weeks=i) for i in range(args.weeks)])
+    else:
+        fetch_boxoffice_json(reference_date)
 
 """NOTE:
      Python 會在執行檔案時自動設定內建變數 __name__。
@@ -8,33 +8,41 @@ OMDb 整合爬蟲（Info + Rating）
 📂 資料流：
     input  : data/raw/boxoffice_permovie/<year>/<week>/
     output : data/raw/omdb/<year>/<week>/<gov_id>_<title_zh>_<imdb_id>.json
-    error  : data/raw/omdb/error/error_<timestamp>.json
+    error  : data/raw/omdb/error/error_<timestamp>.jsonl （每行一筆，發生時即寫入）
+    cache  : data/raw/omdb/cache/ （gov_id → imdb_id 對照快取）
+             data/raw/omdb/response_cache/ （OMDb 回應快取，RESPONSE_CACHE_TTL 內重跑不打 API）
 
 📦 輔助資料：
     - .env → OMDB_API_KEY
     - data/manual_fix/fix_omdb_mapping.json （人工對照表）
+    - data/manual_fix/fix_omdb_mapping_temp.json （人工修正暫存表，refetch_from_temp 補爬用）
 """
 
 # -------------------------------------------------------
 # 套件匯入
 # -------------------------------------------------------
 import os
-import json
-import time
-import requests
+import argparse
+import asyncio
+import orjson
+import unicodedata
+import aiohttp
+from tqdm import tqdm
 from datetime import datetime
-from urllib.parse import quote
+from diskcache import Cache
 from dotenv import load_dotenv
-from tqdm import tqdm
 
 # 共用模組
 from ml.common.path_utils import (
     BOXOFFICE_PERMOVIE_RAW,
     OMDB_RAW,
+    OMDB_CACHE_DIR,
+    OMDB_RESPONSE_CACHE_DIR,
     MANUAL_FIX_DIR,
 )
-from ml.common.file_utils import ensure_dir, save_json, clean_filename, load_json
-from ml.common.date_utils import get_year_label, get_week_label
+from ml.common.file_utils import ensure_dir, save_json, clean_filename, load_json, list_files
+from ml.common.date_utils import get_year_label, get_week_label, now_str
+from ml.common.network_utils import AsyncRateLimiter, backoff_delay, parse_retry_after
 
 
 # -------------------------------------------------------
@@ -47,75 +55,359 @@ YEAR_LABEL = get_year_label()
 WEEK_LABEL = get_week_label()
 
 FIX_MAPPING_FILE = os.path.join(MANUAL_FIX_DIR, "fix_omdb_mapping.json")
-manual_mapping = (
-    json.load(open(FIX_MAPPING_FILE, "r", encoding="utf-8"))
-    if os.path.exists(FIX_MAPPING_FILE)
-    else []
-)
-
-error_records = []  # 儲存略過與異常資料
-SLEEP_INTERVAL = 1.2
+FIX_MAPPING_TEMP = os.path.join(MANUAL_FIX_DIR, "fix_omdb_mapping_temp.json")
+manual_mapping = load_json(FIX_MAPPING_FILE) if os.path.exists(FIX_MAPPING_FILE) else []
+# 人工對照表依 gov_id 建索引（同一 gov_id 重複時以第一筆為準，與原本逐筆比對結果相同）
+manual_mapping_by_gov_id = {}
+for item in manual_mapping:
+    manual_mapping_by_gov_id.setdefault(str(item.get("gov_id")), item)
+
+error_count = 0  # 略過與異常資料筆數（明細逐筆寫入 ERROR_FILE，不在記憶體累積）
+OMDB_RPM = 120  # 每 60 秒最多發出的 OMDb 請求數
+# 同時進行中的 OMDb 請求上限（遇 429/5xx 時自動減半）；可用環境變數 OMDB_CONCURRENCY 調整
+MAX_CONCURRENCY = int(os.getenv("OMDB_CONCURRENCY", "5"))
+OMDB_API_URL = "https://www.omdbapi.com/"
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=10)
+MAX_RETRIES = 4  # 連線錯誤、逾時、429/5xx 的重試次數
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RESPONSE_CACHE_TTL = 24 * 60 * 60  # OMDb 回應快取有效秒數（評分會更新，只讓同日重跑沿用）
 
 # 資料夾目錄
 INPUT_DIR = os.path.join(BOXOFFICE_PERMOVIE_RAW, YEAR_LABEL, WEEK_LABEL)
 OUTPUT_DIR = os.path.join(OMDB_RAW, YEAR_LABEL, WEEK_LABEL)
 ERROR_DIR = os.path.join(OMDB_RAW, "error")
+ERROR_FILE = os.path.join(ERROR_DIR, f"error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl")
 # 確定資料夾存在
 ensure_dir(OUTPUT_DIR)
 ensure_dir(ERROR_DIR)
 
+# 以片名查到的 IMDb ID（SQLite 持久化，之後各週直接用 IMDb ID 查）
+#   - gov_id → imdb_id
+#   - ("title", 正規化片名) → imdb_id：不同 gov_id 同片名（重映、不同代理商）共用
+imdb_id_cache = Cache(OMDB_CACHE_DIR, timeout=60)
+
+# OMDb 成功回應：(查詢方式, 正規化查詢字串) → 回應 JSON，過期自動失效
+response_cache = Cache(OMDB_RESPONSE_CACHE_DIR, timeout=60)
+
+# 本次執行中相同查詢只打一次 API：(查詢方式, 正規化查詢字串) → asyncio.Task
+inflight_requests = {}
+
 
 # -------------------------------------------------------
 # 工具函式
 # -------------------------------------------------------
 def save_error(error_type: str, reason: str, extra: dict = None):
-    """統一記錄錯誤訊息"""
+    """統一記錄錯誤訊息：逐筆追加到 ERROR_FILE（JSON Lines）"""
+    global error_count
     record = {
         "type": error_type,
         "reason": reason,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": now_str(),
     }
     if extra:
         record.update(extra)
-    error_records.append(record)
+    with open(ERROR_FILE, "ab") as f:
+        f.write(orjson.dumps(record) + b"\n")
+    error_count += 1
 
 
 def find_manual_imdb_id(gov_id: str) -> dict:
     """從人工對照表中尋找 IMDb ID"""
-    for item in manual_mapping:
-        if str(item.get("gov_id")) == str(gov_id):
-            return {"imdb_id": item.get("imdb_id"), "is_matched": True}
-    return {"imdb_id": "", "is_matched": False}
-
-
-def fetch_omdb(api_param: str, by: str = "title") -> dict:
-    """呼叫 OMDb API（可用 title 或 id 查詢）"""
-    if by == "title":
-        url = f"https://www.omdbapi.com/?apikey={API_KEY}&t={quote(api_param)}&plot=full"
-    else:
-        url = f"https://www.omdbapi.com/?apikey={API_KEY}&i={api_param}&plot=full"
+    item = manual_mapping_by_gov_id.get(str(gov_id))
+    if item is None:
+        return {"imdb_id": "", "is_matched": False}
+    return {"imdb_id": item.get("imdb_id"), "is_matched": True}
+
+
+async def fetch_omdb(
+    session: aiohttp.ClientSession,
+    limiter: AsyncRateLimiter,
+    api_param: str,
+    by: str = "title",
+) -> dict:
+    """
+    呼叫 OMDb API（可用 title 或 id 查詢），請求節奏由 limiter 控制
+
+    連線錯誤、逾時與 429/5xx 以指數退避重試（有 Retry-After 時依其秒數），
+    其餘 HTTP 錯誤與 OMDb 回傳的 Response=False（查無電影）不重試
+    """
+    params = {"apikey": API_KEY, "plot": "full"}
+    params["t" if by == "title" else "i"] = api_param
+
+    for attempt in range(MAX_RETRIES + 1):
+        retry_after = None
+        await limiter.acquire()
+        try:
+            async with session.get(OMDB_API_URL, params=params) as response:
+                limiter.on_response(response.status, response.headers)
+                if response.status in RETRY_STATUS and attempt < MAX_RETRIES:
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                else:
+                    response.raise_for_status()
+                    return await response.json(content_type=None, loads=orjson.loads)
+        except aiohttp.ClientResponseError as e:
+            return {"Response": "False", "Error": str(e)}
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt == MAX_RETRIES:
+                return {"Response": "False", "Error": str(e) or type(e).__name__}
+        finally:
+            await limiter.release()
+
+        await asyncio.sleep(retry_after if retry_after is not None else backoff_delay(attempt))
+
+
+def normalize_query(api_param: str) -> str:
+    """查詢字串正規化（NFKC、去頭尾空白、不分大小寫），作為去重鍵"""
+    return unicodedata.normalize("NFKC", api_param).strip().casefold()
+
+
+async def fetch_omdb_cached(
+    session: aiohttp.ClientSession,
+    limiter: AsyncRateLimiter,
+    api_param: str,
+    by: str = "title",
+) -> dict:
+    """先查回應快取，未命中才呼叫 API；只快取成功回應（Response=True）"""
+    key = (by, normalize_query(api_param))
+    data = response_cache.get(key)
+    if data is not None:
+        return data
+
+    data = await fetch_omdb(session, limiter, api_param, by=by)
+    if data.get("Response") == "True":
+        response_cache.set(key, data, expire=RESPONSE_CACHE_TTL)
+    return data
+
+
+async def fetch_omdb_shared(
+    session: aiohttp.ClientSession,
+    limiter: AsyncRateLimiter,
+    api_param: str,
+    by: str = "title",
+) -> dict:
+    """
+    同一次執行中相同查詢共用同一個請求（含進行中的請求）
+
+    回傳淺複製，呼叫端加入 crawl_note 時不會互相覆蓋
+    """
+    key = (by, normalize_query(api_param))
+    if key not in inflight_requests:
+        inflight_requests[key] = asyncio.ensure_future(
+            fetch_omdb_cached(session, limiter, api_param, by=by)
+        )
+    return dict(await inflight_requests[key])
+
+
+async def save_omdb_result(data: dict, gov_file_info: dict, fetch_mode: str) -> None:
+    """印出成功訊息、加上 crawl_note 後儲存為 <gov_id>_<title_zh>_<imdb_id>.json"""
+    imdb_id = data["imdbID"]
+    rating = data.get("imdbRating", "")
+    votes = data.get("imdbVotes", "")
+
+    print(
+        f"[成功] {gov_file_info['gov_title_zh']} ({gov_file_info['gov_title_en']}) "
+        f"- IMDb {rating} ({votes}) [{fetch_mode}]"
+    )
+
+    # 加上爬取資訊區塊
+    data["crawl_note"] = {
+        **gov_file_info,
+        "imdb_id": imdb_id,
+        "source": "omdb",
+        "fetch_mode": fetch_mode,
+        "week_label": WEEK_LABEL,
+        "year_label": YEAR_LABEL,
+        "fetched_at": now_str(),
+    }
 
-    try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        return {"Response": "False", "Error": str(e)}
+    # 儲存檔案（交給執行緒池，事件迴圈只等待網路）
+    file_name_out = f"{gov_file_info['gov_id']}_{gov_file_info['gov_title_zh']}_{imdb_id}.json"
+    await asyncio.to_thread(save_json, data, OUTPUT_DIR, file_name_out)
 
 
 # -------------------------------------------------------
 # 主流程
 # -------------------------------------------------------
-def crawl_omdb_for_week():
-    """主函式：以本週票房電影為基準撈取 OMDb 資料"""
+async def process_movie(
+    session: aiohttp.ClientSession, limiter: AsyncRateLimiter, file_name: str
+) -> bool:
+    """處理單部電影：讀取票房原始檔 → 查詢 OMDb → 儲存結果，成功時回傳 True"""
+    file_path = os.path.join(INPUT_DIR, file_name)
+
+    try:
+        # 讀寫檔交給執行緒池，事件迴圈只等待網路
+        raw_json = await asyncio.to_thread(load_json, file_path)
+        movie_data = raw_json.get("data", {})
+        # -------------------------------------------------
+        # 前置檢查
+        # -------------------------------------------------
+        # 確認 data/raw/boxoffice_permovie/<year>/<week> 有資料
+        if not movie_data:
+            save_error("empty_json", "無有效內容", {"file": file_name})
+            print(f"⚠️ 無有效內容：{file_name}")
+            return False
+
+        gov_id = str(movie_data.get("movieId") or "")
+        gov_title_zh = clean_filename(str(movie_data.get("name") or ""))
+        gov_title_en = str(movie_data.get("originalName") or "").strip()
+        gov_file_info = {
+            "gov_id": gov_id,
+            "gov_title_zh": gov_title_zh,
+            "gov_title_en": gov_title_en,
+        }
+
+        # 不爬無英文片名的電影
+        if not gov_title_en:
+            save_error(
+                "missing_en_title",
+                "無英文片名",
+                gov_file_info,
+            )
+            return False
+
+        # -------------------------------------------------
+        # 開始爬取資料
+        # -------------------------------------------------
+        # 優先用人工 mapping
+        mapping = find_manual_imdb_id(gov_id)
+        imdb_id = mapping["imdb_id"]
+        title_key = ("title", normalize_query(gov_title_en))
+        cached_imdb_id = imdb_id_cache.get(gov_id) or imdb_id_cache.get(title_key)
+
+        if imdb_id:
+            # 第二次爬取：已加入至人工對照表，直接用 IMDb ID 查
+            data = await fetch_omdb_shared(session, limiter, imdb_id, by="id")
+            fetch_mode = "by_imdb_id_from_manual_fix"
+        else:
+            if mapping["is_matched"] == True:
+                save_error(
+                    "omdb查不到資料(已記錄在人工對照表)", "OMDb 查不到資料", gov_file_info
+                )
+                return False
+            elif cached_imdb_id:
+                # 之前週次已用片名對應成功：直接用快取的 IMDb ID 查
+                data = await fetch_omdb_shared(session, limiter, cached_imdb_id, by="id")
+                fetch_mode = "by_imdb_id_from_cache"
+            else:
+                # 第一次爬取：以英文片名查詢
+                data = await fetch_omdb_shared(session, limiter, gov_title_en, by="title")
+                fetch_mode = "by_title_from_gov"
+
+                if data.get("Response") == "False":
+                    save_error("Movie not found", "OMDb 查不到資料", gov_file_info)
+                    return False
+
+        # -------------------------------------------------
+        # 儲存成功結果
+        # -------------------------------------------------
+        if data.get("Response") == "True" and data.get("imdbID"):
+            # 記錄片名對應結果，下次直接用 IMDb ID 查
+            if fetch_mode == "by_title_from_gov":
+                imdb_id_cache[gov_id] = data["imdbID"]
+                imdb_id_cache[title_key] = data["imdbID"]
+
+            await save_omdb_result(data, gov_file_info, fetch_mode)
+            return True
+
+        else:
+            save_error("api_error", data.get("Error", "OMDb 回傳失敗"), gov_file_info)
+            print(f"[失敗] {gov_title_zh} ({gov_title_en}) - {data.get('Error', '未知錯誤')}")
+            return False
+
+    except Exception as e:
+        save_error("exception", str(e), {"file": file_name})
+        print(f"[例外] {file_name} - {e}")
+        return False
+
+
+async def refetch_movie(
+    session: aiohttp.ClientSession, limiter: AsyncRateLimiter, item: dict
+) -> bool:
+    """補爬單部電影：以人工暫存表中的 IMDb ID 直接查詢並儲存，成功時回傳 True"""
+    try:
+        gov_file_info = {
+            "gov_id": str(item.get("gov_id") or ""),
+            "gov_title_zh": clean_filename(str(item.get("gov_title_zh") or "")),
+            "gov_title_en": str(item.get("gov_title_en") or "").strip(),
+        }
+        imdb_id = str(item.get("imdb_id") or "").strip()
+
+        # 排除無IMDb ID(IMDb 無此電影)
+        if not imdb_id:
+            save_error("skip_no_imdb_id", "無 IMDb ID（人工標記為無資料）", item)
+            print(f"⚠️ 跳過：{gov_file_info['gov_id']} {gov_file_info['gov_title_zh']}，因 IMDb 無此電影")
+            return False
+
+        data = await fetch_omdb_shared(session, limiter, imdb_id, by="id")
+
+        if data.get("Response") == "True" and data.get("imdbID"):
+            await save_omdb_result(data, gov_file_info, "by_imdb_id_from_temp")
+            return True
+
+        save_error("api_error", data.get("Error", "OMDb 回傳失敗"), item)
+        print(
+            f"[失敗] {gov_file_info['gov_title_zh']} ({gov_file_info['gov_title_en']}) "
+            f"- {data.get('Error', '未知錯誤')}"
+        )
+        return False
+
+    except Exception as e:
+        save_error("exception", str(e), item)
+        print(f"[例外] {item.get('gov_title_zh')} - {e}")
+        return False
+
+
+async def run_omdb_tasks(worker, items: list, desc: str = "OMDb") -> int:
+    """
+    以共用 session 併發處理所有項目，回傳成功筆數
+
+    所有項目一次建立成 task，實際同時進行的請求數由 limiter 控制；
+    以 as_completed 依完成順序收結果，進度條即時更新，重試退避中的項目不會卡住其他項目。
+    連線池以 limit_per_host 對齊併發上限，全程沿用同一組 keep-alive 連線
+
+    Args:
+        worker: async (session, limiter, item) -> bool，例如 process_movie / refetch_movie
+        items: 要處理的項目
+        desc: 進度條標題
+    """
+    limiter = AsyncRateLimiter(rpm=OMDB_RPM, max_concurrency=MAX_CONCURRENCY)
+    inflight_requests.clear()
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_CONCURRENCY, ttl_dns_cache=300)
+    success_count = 0
+
+    async with aiohttp.ClientSession(connector=connector, timeout=REQUEST_TIMEOUT) as session:
+        tasks = [asyncio.create_task(worker(session, limiter, item)) for item in items]
+        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc=desc, ncols=90):
+            success_count += await task
+
+    return success_count
+
+
+async def crawl_omdb_async(json_files: list) -> int:
+    """併發處理本週所有票房原始檔，回傳成功筆數"""
+    return await run_omdb_tasks(process_movie, json_files, desc="OMDb")
+
+
+def crawl_omdb_for_week(skip_existing: bool = True, refresh: bool = False):
+    """
+    主函式：以本週票房電影為基準撈取 OMDb 資料
+
+    Args:
+        skip_existing: 本週輸出資料夾已有該 gov_id 的結果時略過（重跑時不重複打 API）
+        refresh: 先清除 OMDb 回應快取，強制重新查詢（gov_id → imdb_id 對照保留）
+    """
     if not API_KEY:
         raise ValueError("❌ 找不到 OMDB_API_KEY，請確認 .env 是否設定")
 
+    if refresh:
+        response_cache.clear()
+        print("🧹 已清除 OMDb 回應快取")
+
     if not os.path.exists(INPUT_DIR):
         print(f"⚠️ 找不到本週票房原始資料夾：{INPUT_DIR}")
         return
 
-    json_files = [f for f in os.listdir(INPUT_DIR) if f.endswith(".json")]
+    json_files = list_files(INPUT_DIR, "json")
     if not json_files:
         print(f"⚠️ 沒有可用的 JSON 檔案：{INPUT_DIR}")
         return
@@ -123,123 +415,64 @@ def crawl_omdb_for_week():
     print(f"🎬 發現 {len(json_files)} 部電影待爬取 OMDb 資料")
     print(f"📅 週期：{WEEK_LABEL}\n")
 
-    success_count = 0
+    # 1️⃣ 先一次比對本週已輸出的 gov_id（檔名前綴），只把未完成的電影送進併發查詢
+    if skip_existing:
+        done_ids = {f.split("_", 1)[0] for f in list_files(OUTPUT_DIR, "json")}
+        pending_files = [f for f in json_files if f.split("_", 1)[0] not in done_ids]
+        if len(pending_files) < len(json_files):
+            print(f"⏭️ 本週已有結果，略過 {len(json_files) - len(pending_files)} 部電影")
+        json_files = pending_files
 
-    # 2️⃣ 逐一處理電影
-    for file_name in tqdm(json_files, desc="OMDb Fetching", ncols=90):
-        file_path = os.path.join(INPUT_DIR, file_name)
+    # 2️⃣ 併發處理電影（請求速率與併發數由 AsyncRateLimiter 控制）
+    success_count = asyncio.run(crawl_omdb_async(json_files))
 
-        try:
-            raw_json = load_json(file_path)
-            movie_data = raw_json.get("data", {})
-            # -------------------------------------------------
-            # 前置檢查
-            # -------------------------------------------------
-            # 確認 data/raw/boxoffice_permovie/<year>/<week> 有資料
-            if not movie_data:
-                save_error("empty_json", "無有效內容", {"file": file_name})
-                print(f"⚠️ 無有效內容：{file_name}")
-                continue
-
-            gov_id = str(movie_data.get("movieId") or "")
-            gov_title_zh = clean_filename(str(movie_data.get("name") or ""))
-            gov_title_en = str(movie_data.get("originalName") or "").strip()
-            gov_file_info = {
-                "gov_id": gov_id,
-                "gov_title_zh": gov_title_zh,
-                "gov_title_en": gov_title_en,
-            }
-
-            # 不爬無英文片名的電影
-            if not gov_title_en:
-                save_error(
-                    "missing_en_title",
-                    "無英文片名",
-                    gov_file_info,
-                )
-                continue
-
-            # -------------------------------------------------
-            # 開始爬取資料
-            # -------------------------------------------------
-            # 優先用人工 mapping
-            mapping = find_manual_imdb_id(gov_id)
-            imdb_id = mapping["imdb_id"]
-
-            if imdb_id:
-                # 第二次爬取：已加入至人工對照表，直接用 IMDb ID 查
-                data = fetch_omdb(imdb_id, by="id")
-                fetch_mode = "by_imdb_id_from_manual_fix"
-            else:
-                if mapping["is_matched"] == True:
-                    save_error(
-                        "omdb查不到資料(已記錄在人工對照表)", "OMDb 查不到資料", gov_file_info
-                    )
-                    continue
-                else:
-                    # 第一次爬取：以英文片名查詢
-                    data = fetch_omdb(gov_title_en, by="title")
-                    fetch_mode = "by_title_from_gov"
-
-                    if data.get("Response") == "False":
-                        save_error("Movie not found", "OMDb 查不到資料", gov_file_info)
-                        continue
-
-            # -------------------------------------------------
-            # 儲存成功結果
-            # -------------------------------------------------
-            if data.get("Response") == "True" and data.get("imdbID"):
-                imdb_id = data["imdbID"]
-                rating = data.get("imdbRating", "")
-                votes = data.get("imdbVotes", "")
-
-                print(
-                    f"[成功] {gov_title_zh} ({gov_title_en}) - IMDb {rating} ({votes}) [{fetch_mode}]"
-                )
+    # 4️⃣ 統計輸出
+    print("\n==============================")
+    print("🎉 本週 OMDb 資料抓取完成")
+    print(f"📅 週期：{WEEK_LABEL}")
+    print(f"✅ 成功：{success_count} 筆")
+    print(f"❌ 失敗：{error_count} 筆")
+    print(f"📁 輸出資料夾：{OUTPUT_DIR}")
+    print("==============================\n")
 
-                # 加上爬取資訊區塊
-                data["crawl_note"] = {
-                    "gov_id": gov_id,
-                    "gov_title_zh": gov_title_zh,
-                    "gov_title_en": gov_title_en,
-                    "imdb_id": imdb_id,
-                    "source": "omdb",
-                    "fetch_mode": fetch_mode,
-                    "week_label": WEEK_LABEL,
-                    "year_label": YEAR_LABEL,
-                    "fetched_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                }
-
-                # 儲存檔案
-                file_name_out = f"{gov_id}_{gov_title_zh}_{imdb_id}.json"
-                save_json(data, OUTPUT_DIR, file_name_out)
-                success_count += 1
+    # 5️⃣ 錯誤紀錄（已於發生時逐筆寫入）
+    if error_count:
+        print(f"⚠️ 已輸出錯誤紀錄 {error_count} 筆 → {os.path.basename(ERROR_FILE)}")
+    else:
+        print("✅ 無異常紀錄")
 
-            else:
-                save_error("api_error", data.get("Error", "OMDb 回傳失敗"), gov_file_info)
-                print(f"[失敗] {gov_title_zh} ({gov_title_en}) - {data.get('Error', '未知錯誤')}")
 
-        except Exception as e:
-            save_error("exception", str(e), {"file": file_name})
-            print(f"[例外] {file_name} - {e}")
-            continue
+def refetch_from_temp():
+    """重爬人工暫存對照表中的電影（與每週爬蟲共用 session、限流、快取與存檔流程）"""
+    if not API_KEY:
+        raise ValueError("❌ 找不到 OMDB_API_KEY，請確認 .env 是否設定")
 
-        time.sleep(SLEEP_INTERVAL)
+    if not os.path.exists(FIX_MAPPING_TEMP):
+        print(f"⚠️ 找不到檔案：{FIX_MAPPING_TEMP}")
+        return
 
-    # 4️⃣ 統計輸出
+    # 讀取暫存對照表
+    fix_list = load_json(FIX_MAPPING_TEMP)
+    if not fix_list:
+        print(f"⚠️ 檔案為空：{FIX_MAPPING_TEMP}")
+        return
+
+    print(f"🎯 共 {len(fix_list)} 筆電影需重新爬取 OMDb 資料")
+    print(f"📅 週期：{WEEK_LABEL}\n")
+
+    success_count = asyncio.run(run_omdb_tasks(refetch_movie, fix_list, desc="OMDb Refetching"))
+
+    # 統計結果
     print("\n==============================")
-    print("🎉 本週 OMDb 資料抓取完成")
-    print(f"📅 週期：{WEEK_LABEL}")
+    print("🎉 補爬作業完成")
     print(f"✅ 成功：{success_count} 筆")
-    print(f"❌ 失敗：{len(error_records)} 筆")
+    print(f"❌ 失敗：{error_count} 筆")
     print(f"📁 輸出資料夾：{OUTPUT_DIR}")
     print("==============================\n")
 
-    # 5️⃣ 輸出錯誤紀錄
-    if error_records:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        save_json(error_records, ERROR_DIR, f"error_{timestamp}.json")
-        print(f"⚠️ 已輸出錯誤紀錄 {len(error_records)} 筆 → error_{timestamp}.json")
+    # 錯誤紀錄（已於發生時逐筆寫入）
+    if error_count:
+        print(f"⚠️ 已輸出錯誤紀錄 {error_count} 筆 → {os.path.basename(ERROR_FILE)}")
     else:
         print("✅ 無異常紀錄")
 
@@ -248,4 +481,18 @@ def crawl_omdb_for_week():
 # 主程式執行入口
 # -------------------------------------------------------
 if __name__ == "__main__":
-    crawl_omdb_for_week()
+    parser = argparse.ArgumentParser(description="以本週票房電影為基準撈取 OMDb 資料")
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="清除 OMDb 回應快取後重新查詢（預設沿用 24 小時內的快取）",
+    )
+    parser.add_argument(
+        "--no-skip-existing",
+        action="store_true",
+        help="本週已有輸出結果的電影也重新處理",
+    )
+
+    args = parser.parse_args()
+
+    crawl_omdb_for_week(skip_existing=not args.no_skip_existing, refresh=args.refresh)
@@ -9,10 +9,12 @@
 """
 
 import os
+import glob
 import argparse
-import json
+import orjson
 import pandas as pd
 from datetime import datetime, date
+from concurrent.futures import ProcessPoolExecutor
 
 # 共用模組
 from ml.common.path_utils import (
@@ -20,10 +22,12 @@ from ml.common.path_utils import (
     BOXOFFICE_PERMOVIE_PROCESSED,
     MOVIEINFO_GOV_PROCESSED,
 )
-from ml.common.file_utils import ensure_dir, save_csv, clean_filename
+from ml.common.file_utils import ensure_dir, save_csv, save_csv_rows, clean_filename, list_files
 from ml.common.date_utils import get_week_label, get_year_label, get_last_week_range
 
 # ========= 全域設定 =========
+# 清洗用的行程數（None = CPU 核心數）；待清洗檔案不超過 1 個時直接在主行程處理
+MAX_WORKERS = None
 
 
 # ========= 輔助工具 =========
@@ -97,6 +101,63 @@ def flatten_weekly_boxoffice(movie_data: dict, gov_id: str, releaseDate: str) ->
     ]
 
 
+# 移除同一 gov_id 但片名不同的舊輸出檔
+def remove_stale_gov_files(dir_path: str, gov_id, keep_filename: str) -> None:
+    """
+    輸出檔以 {gov_id}_{片名} 命名，片名改變（例如重映版）時舊檔不會被覆寫，
+    後續合併時同一 gov_id 會重複；寫入新檔前先刪除同 gov_id 的其他檔案，只保留最新一週的結果
+    """
+    pattern = os.path.join(glob.escape(dir_path), f"{glob.escape(str(gov_id))}_*.csv")
+    for path in glob.glob(pattern):
+        if os.path.basename(path) != keep_filename:
+            os.remove(path)
+            print(f"🗑️ 已移除片名變更前的舊檔：{path}")
+
+
+# 清洗單一電影原始檔
+def clean_permovie_file(file_path: str, output_dir: str) -> str:
+    """
+    清洗單一電影原始 JSON，輸出電影資訊與週票房 CSV，回傳結果狀態：
+    "success"（成功）/ "invalid"（無有效內容）/ "no_weeks"（無週次資料）
+
+    定義在模組層級，才能交給 ProcessPoolExecutor 在子行程執行
+    """
+    file = os.path.basename(file_path)
+
+    with open(file_path, "rb") as f:
+        raw_data = orjson.loads(f.read())
+
+    crawler_data = raw_data.get("data", {})
+    if not crawler_data:
+        print(f"⚠️ {file} 無有效內容")
+        return "invalid"
+
+    # Step 1️⃣：電影資訊
+    processed_data_info = parse_movie_info(crawler_data)
+    safe_title = clean_filename(processed_data_info["gov_title_zh"] or "unknown")
+
+    # 單列電影資訊直接寫成 CSV，不必為一列資料建立 DataFrame
+    info_filename = f"{processed_data_info['gov_id']}_{safe_title}.csv"
+    remove_stale_gov_files(MOVIEINFO_GOV_PROCESSED, processed_data_info["gov_id"], info_filename)
+    save_csv_rows([processed_data_info], MOVIEINFO_GOV_PROCESSED, info_filename)
+
+    # Step 2️⃣：整理週票房資料
+    df_weeks = flatten_weekly_boxoffice(
+        crawler_data,
+        processed_data_info["gov_id"],
+        processed_data_info["official_release_date"],
+    )
+    if df_weeks.empty:
+        print(f"⚠️ 無週次資料：{file}")
+        return "no_weeks"
+
+    csv_filename = f"{processed_data_info['gov_id']}_{safe_title}.csv"
+    remove_stale_gov_files(output_dir, processed_data_info["gov_id"], csv_filename)
+    save_csv(df_weeks, output_dir, csv_filename)
+    print(f"✅ 已清洗：{csv_filename}")
+    return "success"
+
+
 # ========= 主程式 =========
 def clean_boxoffice_permovie(reference_date: date | None = None):
 
@@ -117,46 +178,20 @@ def clean_boxoffice_permovie(reference_date: date | None = None):
         print(f"⚠️ 找不到資料夾：{input_dir}")
         return
 
-    files = [f for f in os.listdir(input_dir) if f.endswith(".json")]
+    files = list_files(input_dir, "json")
     print(f"📂 準備清洗 {len(files)} 部電影資料\n")
 
-    success_count = 0
-    invalid_data_count = 0
-
-    # 逐步清洗單一電影
-    for file in files:
-        file_path = os.path.join(input_dir, file)
-
-        with open(file_path, "r", encoding="utf-8") as f:
-            raw_data = json.load(f)
-
-        crawler_data = raw_data.get("data", {})
-        if not crawler_data:
-            print(f"⚠️ {file} 無有效內容")
-            invalid_data_count += 1
-            continue
-
-        # Step 1️⃣：電影資訊
-        processed_data_info = parse_movie_info(crawler_data)
-        safe_title = clean_filename(processed_data_info["gov_title_zh"] or "unknown")
-
-        df_info = pd.DataFrame([processed_data_info])
-        info_filename = f"{processed_data_info['gov_id']}_{safe_title}.csv"
-        save_csv(df_info, MOVIEINFO_GOV_PROCESSED, info_filename)
-
-        # Step 2️⃣：整理週票房資料
-        df_weeks = flatten_weekly_boxoffice(
-            crawler_data,
-            processed_data_info["gov_id"],
-            processed_data_info["official_release_date"],
-        )
-        if not df_weeks.empty:
-            csv_filename = f"{processed_data_info['gov_id']}_{safe_title}.csv"
-            save_csv(df_weeks, output_dir, csv_filename)
-            print(f"✅ 已清洗：{csv_filename}")
-            success_count += 1
-        else:
-            print(f"⚠️ 無週次資料：{file}")
+    # 逐一清洗單一電影（各檔案互不相依，多個檔案時以多行程並行）
+    file_paths = [os.path.join(input_dir, file) for file in files]
+    output_dirs = [output_dir] * len(file_paths)
+    if len(file_paths) > 1:
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(clean_permovie_file, file_paths, output_dirs, chunksize=8))
+    else:
+        results = [clean_permovie_file(p, d) for p, d in zip(file_paths, output_dirs)]
+
+    success_count = results.count("success")
+    invalid_data_count = results.count("invalid")
 
     # ------------------------------------------------
     # 統計輸出
@@ -8,11 +8,59 @@
 """
 
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 import pandas
 import os
-from ml.common.file_utils import load_json, save_csv, ensure_dir
+from ml.common.file_utils import load_json, save_csv, ensure_dir, list_files
 from ml.common.path_utils import BOXOFFICE_RAW, BOXOFFICE_PROCESSED
 
+# === 保留的欄位 ===
+KEEP_COLS = [
+    "movieId",
+    "rank",
+    "name",
+    "releaseDate",
+    "publisher",
+    "dayCount",
+    "theaterCount",
+    "amount",
+    "tickets",
+    "marketShare",
+    "totalDayCount",
+    "totalAmount",
+    "totalTickets",
+]
+"""NOTE:目前預設全數保留
+"""
+
+# 轉換用的行程數（None = CPU 核心數）；待轉換檔案不超過 1 個時直接在主行程處理
+MAX_WORKERS = None
+
+
+def convert_boxoffice_json(json_path: Path, output_year_dir: str) -> tuple[bool, str]:
+    """
+    將單一週票房 JSON 轉為 CSV，回傳 (是否成功, 失敗訊息)
+
+    定義在模組層級，才能交給 ProcessPoolExecutor 在子行程執行
+    """
+    try:
+        data = load_json(str(json_path))
+        records = data.get("data", {}).get("dataItems", [])
+
+        if not records:
+            return False, f"⚠️ 找不到 dataItems：{os.path.basename(json_path)}"
+
+        # 只建立需要的欄位（若有遺漏則自動略過），不先把整份紀錄轉成 DataFrame 再挑欄位
+        present_cols = set().union(*records)
+        df = pandas.DataFrame(records, columns=[c for c in KEEP_COLS if c in present_cols])
+
+        # === 儲存 CSV ===
+        save_csv(df, output_year_dir, f"{json_path.stem}.csv")
+        return True, ""
+
+    except Exception as e:
+        return False, f"❌ 轉換失敗 {os.path.basename(json_path)}：{e}"
+
 
 def clean_new_boxoffice_json():
     """比對新檔案並將原始 JSON 轉為結構化 CSV（依年份輸出）"""
@@ -36,62 +84,40 @@ def clean_new_boxoffice_json():
 
     print(f"📦 發現 {total_files} 個待檢查 JSON 檔案。\n")
 
-    # === 保留的欄位 ===
-    keep_cols = [
-        "movieId",
-        "rank",
-        "name",
-        "releaseDate",
-        "publisher",
-        "dayCount",
-        "theaterCount",
-        "amount",
-        "tickets",
-        "marketShare",
-        "totalDayCount",
-        "totalAmount",
-        "totalTickets",
-    ]
-    """NOTE:目前預設全數保留
-    """
-
-    # === 開始逐一轉換 ===
+    # === 篩出待轉換的檔案 ===
+    pending_paths = []
+    pending_dirs = []
+    processed_stems = {}  # 輸出資料夾 → 已存在的 CSV 主檔名集合（每個資料夾只列一次）
     for json_path in raw_files:
-        try:
-            year_folder = json_path.parent.name  # 例如 "2025"
-            stem = json_path.stem  # 例如 "boxoffice_2025W43_1013-1019"
+        year_folder = json_path.parent.name  # 例如 "2025"
+        stem = json_path.stem  # 例如 "boxoffice_2025W43_1013-1019"
 
-            # === 設定輸出資料夾與檔案路徑 ===
-            output_year_dir = os.path.join(BOXOFFICE_PROCESSED, year_folder)
+        # === 設定輸出資料夾 ===
+        output_year_dir = os.path.join(BOXOFFICE_PROCESSED, year_folder)
+        if output_year_dir not in processed_stems:
             ensure_dir(output_year_dir)
+            processed_stems[output_year_dir] = {f[:-4] for f in list_files(output_year_dir, "csv")}
 
-            csv_path = os.path.join(output_year_dir, f"{stem}.csv")
+        # 若 processed 已存在同名 CSV → 略過
+        if stem in processed_stems[output_year_dir]:
+            skip_count += 1
+            continue
 
-            # 若 processed 已存在同名 CSV → 略過
-            if os.path.exists(csv_path):
-                skip_count += 1
-                continue
+        pending_paths.append(json_path)
+        pending_dirs.append(output_year_dir)
 
-            data = load_json(str(json_path))
-            records = data.get("data", {}).get("dataItems", [])
+    # === 開始轉換（各檔案互不相依，多個檔案時以多行程並行）===
+    if len(pending_paths) > 1:
+        with ProcessPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(convert_boxoffice_json, pending_paths, pending_dirs, chunksize=4))
+    else:
+        results = [convert_boxoffice_json(p, d) for p, d in zip(pending_paths, pending_dirs)]
 
-            if not records:
-                print(f"⚠️ 找不到 dataItems：{os.path.basename(json_path)}")
-                fail_count += 1
-                continue
-
-            df = pandas.DataFrame(records)
-
-            # 保留需要的欄位（若有遺漏則自動略過）
-            existing_cols = [c for c in keep_cols if c in df.columns]
-            df = df[existing_cols]
-
-            # === 儲存 CSV ===
-            save_csv(df, output_year_dir, f"{stem}.csv")
+    for ok, message in results:
+        if ok:
             success_count += 1
-
-        except Exception as e:
-            print(f"❌ 轉換失敗 {os.path.basename(json_path)}：{e}")
+        else:
+            print(message)
             fail_count += 1
 
     # ------------------------------------------------
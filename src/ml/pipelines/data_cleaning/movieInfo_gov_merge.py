@@ -13,9 +13,10 @@
 """
 
 import os
+import csv
 import pandas as pd
 from datetime import datetime
-from ml.common.file_utils import save_csv  # 若你的 save_csv 能接受資料夾 + 檔名
+from ml.common.file_utils import save_csv, list_files  # 若你的 save_csv 能接受資料夾 + 檔名
 from ml.common.path_utils import MOVIEINFO_GOV_PROCESSED, MOVIEINFO_GOV_COMBINED_PROCESSED
 
 
@@ -23,8 +24,8 @@ from ml.common.path_utils import MOVIEINFO_GOV_PROCESSED, MOVIEINFO_GOV_COMBINED
 # 主程式
 # -------------------------------------------------------
 def merge_movieInfo_gov():
-    all_data = []
-    gov_processed_files = [f for f in os.listdir(MOVIEINFO_GOV_PROCESSED) if f.endswith(".csv")]
+    all_rows = []
+    gov_processed_files = list_files(MOVIEINFO_GOV_PROCESSED, "csv")
 
     if not gov_processed_files:
         print("⚠️ 找不到任何 CSV 檔案，請確認資料夾路徑是否正確。")
@@ -38,19 +39,21 @@ def merge_movieInfo_gov():
     for file in gov_processed_files:
         file_path = os.path.join(MOVIEINFO_GOV_PROCESSED, file)
         try:
-            df = pd.read_csv(file_path, encoding="utf-8")
-            df["source_file"] = file  # 保留原始檔名供追蹤
-            all_data.append(df)
-            success_count += len(df)
+            # 每支檔案只有一列電影資訊：直接以 csv 模組讀列，最後一次建立 DataFrame，
+            # 不必每支檔案各跑一次 pandas 解析再 concat（utf-8-sig 去除 save_csv 寫入的 BOM）
+            with open(file_path, "r", encoding="utf-8-sig", newline="") as f:
+                rows = [dict(row, source_file=file) for row in csv.DictReader(f)]  # 保留原始檔名供追蹤
+            all_rows.extend(rows)
+            success_count += len(rows)
         except Exception as e:
             fail_files.append(file)
             print(f"⚠️ 無法讀取檔案：{file}，原因：{e}")
 
-    if not all_data:
+    if not all_rows:
         print("⚠️ 無資料可合併。")
         return
 
-    merged_df = pd.concat(all_data, ignore_index=True)
+    merged_df = pd.DataFrame(all_rows)
 
     # 統一欄位順序
     col_order = [
@@ -19,6 +19,7 @@ OMDb 清洗 + 評分資料整併模組
 # 套件匯入
 # -------------------------------------------------------
 import os
+import csv
 import pandas as pd
 from datetime import datetime
 
@@ -28,8 +29,8 @@ from ml.common.path_utils import (
     RATING_OMDB_PROCESSED,
     RATING_OMDB_PROCESSED,
 )
-from ml.common.file_utils import ensure_dir, load_json, save_csv, clean_filename
-from ml.common.date_utils import get_year_label, get_week_label
+from ml.common.file_utils import ensure_dir, load_json, save_csv, clean_filename, list_files
+from ml.common.date_utils import get_year_label, get_week_label, now_str
 
 # -------------------------------------------------------
 # 全域設定
@@ -95,40 +96,66 @@ def flatten_omdb_json(data: dict) -> dict:
         "tomatoes_rating": tomatoes_rating,
         "metacritic_rating": metacritic_rating,
         "source": note.get("source", "omdb"),
-        "fetched_at": note.get("fetched_at", datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+        "fetched_at": note["fetched_at"] if "fetched_at" in note else now_str(),
     }
 
 
-def combine_all_csv(processed_dir: str, combined_dir: str):
-    """合併全部 processed/movieInfo_omdb 下的 CSV 成 movieInfo_omdb_full_<date>.csv"""
-    all_csv = [
-        os.path.join(processed_dir, f) for f in os.listdir(processed_dir) if f.endswith(".csv")
-    ]
+def combine_all_csv(processed_dir: str, combined_dir: str) -> int:
+    """
+    合併全部 processed/movieInfo_omdb 下的 CSV 成 movieInfo_omdb_full_<date>.csv，回傳合併筆數
+
+    逐列讀寫，不把所有資料載入成 DataFrame（記憶體用量與檔案數無關）：
+        - 先只讀各檔表頭，取欄位聯集（依出現順序），缺少的欄位留空
+        - 再逐檔逐列寫出，同一 imdb_id 只保留第一筆
+    """
+    all_csv = [os.path.join(processed_dir, f) for f in list_files(processed_dir, "csv")]
     if not all_csv:
         print("⚠️ 無可合併的 CSV 檔案。")
-        return None
+        return 0
 
-    dfs = [pd.read_csv(f, encoding="utf-8") for f in all_csv]
-    combined_df = pd.concat(dfs, ignore_index=True)
-    combined_df.drop_duplicates(subset=["imdb_id"], inplace=True)
+    # 第一輪：只讀表頭，取得欄位聯集
+    fieldnames = {}
+    for path in all_csv:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            fieldnames.update(dict.fromkeys(next(csv.reader(f), [])))
 
     today_label = datetime.now().strftime("%Y-%m-%d")
     filename = f"movieInfo_omdb_full_{today_label}.csv"
-    save_csv(combined_df, combined_dir, filename)
-
-    print(f"📁 已產生全域合併：{os.path.join(combined_dir, filename)}")
-    print(f"　共 {len(combined_df)} 筆資料")
-    return combined_df
+    ensure_dir(combined_dir)
+    output_path = os.path.join(combined_dir, filename)
+
+    # 第二輪：逐列串流寫出（格式與 save_csv 相同：BOM + 系統換行）
+    seen_imdb_ids = set()
+    row_count = 0
+    with open(output_path, "w", encoding="utf-8-sig", newline="") as out:
+        writer = csv.DictWriter(
+            out, fieldnames=list(fieldnames), extrasaction="ignore", lineterminator=os.linesep
+        )
+        writer.writeheader()
+        for path in all_csv:
+            with open(path, "r", encoding="utf-8-sig", newline="") as f:
+                for row in csv.DictReader(f):
+                    imdb_id = row.get("imdb_id", "")
+                    if imdb_id in seen_imdb_ids:
+                        continue
+                    seen_imdb_ids.add(imdb_id)
+                    writer.writerow(row)
+                    row_count += 1
+
+    print(f"📁 已產生全域合併：{output_path}")
+    print(f"　共 {row_count} 筆資料")
+    return row_count
 
 
 # ---------------- rating_omdb ----------------
-def build_rating_row(data: dict) -> dict:
-    """從單支 OMDb JSON 提取評分資料"""
+def build_rating_row(data: dict, update_at: str | None = None) -> dict:
+    """從單支 OMDb JSON 提取評分資料（update_at 由呼叫端每批算一次傳入）"""
     note = data.get("crawl_note", {})
     imdb_rating, tomatoes_rating, metacritic_rating = extract_ratings(data)
 
     crawl_date = note.get("fetched_at", "")  # 爬蟲撈資料的時間
-    update_at = datetime.now().strftime("%Y/%m/%d %H:%M")  # 寫入時間
+    if update_at is None:
+        update_at = datetime.now().strftime("%Y/%m/%d %H:%M")  # 寫入時間
 
     return {
         "gov_id": note.get("gov_id", ""),
@@ -145,21 +172,40 @@ def build_rating_row(data: dict) -> dict:
 
 
 def update_movie_rating_csv(row: dict, output_dir: str):
-    """若該電影已有歷史紀錄，則追加一行；若無則新建。"""
+    """若該電影已有歷史紀錄，則追加一行；若無則新建。（只寫入新的一行，不重讀、重寫整個檔案）"""
     gov_id = row["gov_id"]
     imdb_id = row["imdb_id"]
     safe_title = clean_filename(row.get("gov_title_zh", "unknown"))
     filename = f"{gov_id}_{safe_title}_{imdb_id}.csv"
     file_path = os.path.join(output_dir, filename)
 
-    if os.path.exists(file_path):
-        old_df = pd.read_csv(file_path, encoding="utf-8")
-        merged_df = pd.concat([old_df, pd.DataFrame([row])], ignore_index=True)
-    else:
-        merged_df = pd.DataFrame([row])
+    file_exists = os.path.exists(file_path)
+    header = None
+    if file_exists:
+        with open(file_path, newline="", encoding="utf-8-sig") as f:
+            header = next(csv.reader(f), None)
+
+    # 新欄位不在既有表頭內：依欄名合併後整檔重寫（與原本 concat 的行為相同）
+    if header and any(key not in header for key in row):
+        merged_df = pd.concat([pd.read_csv(file_path, encoding="utf-8-sig"), pd.DataFrame([row])], ignore_index=True)
+        save_csv(merged_df, output_dir, filename)
+        print(f"📄 表頭變更，已重寫評分紀錄：{filename}（共 {len(merged_df)} 筆）")
+        return
+
+    # 依既有表頭的欄位順序追加（缺少的欄位留空），新檔則以 row 的 key 為表頭
+    with open(file_path, "a", newline="", encoding="utf-8-sig") as f:
+        writer = csv.DictWriter(
+            f,
+            fieldnames=header or list(row.keys()),
+            restval="",
+            extrasaction="ignore",
+            lineterminator=os.linesep,
+        )
+        if not header:
+            writer.writeheader()
+        writer.writerow(row)
 
-    save_csv(merged_df, output_dir, filename)
-    print(f"📄 已更新評分紀錄：{filename}（共 {len(merged_df)} 筆）")
+    print(f"📄 已{'追加' if header else '新建'}評分紀錄：{filename}")
 
 
 # -------------------------------------------------------
@@ -170,7 +216,7 @@ def clean_omdb_all():
         print(f"⚠️ 找不到原始資料夾：{RAW_DIR}")
         return
 
-    json_files = [f for f in os.listdir(RAW_DIR) if f.endswith(".json")]
+    json_files = list_files(RAW_DIR, "json")
     if not json_files:
         print("⚠️ 無可清洗的 JSON 檔案。")
         return
@@ -179,6 +225,7 @@ def clean_omdb_all():
 
     count_movieinfo = 0
     count_rating = 0
+    update_at = datetime.now().strftime("%Y/%m/%d %H:%M")  # 本批寫入時間（分鐘精度，整批共用）
 
     for file_name in json_files:
         file_path = os.path.join(RAW_DIR, file_name)
@@ -195,7 +242,7 @@ def clean_omdb_all():
         count_movieinfo += 1
 
         # --- 輸出 rating_omdb ---
-        rating_row = build_rating_row(data)
+        rating_row = build_rating_row(data, update_at)
         update_movie_rating_csv(rating_row, RATING_DIR)
         count_rating += 1
 
@@ -47,7 +47,8 @@ from datetime import datetime, timedelta
 
 # 共用模組
 from ml.common.path_utils import BOXOFFICE_PERMOVIE_PROCESSED
-from ml.common.file_utils import ensure_dir
+from ml.common.file_utils import ensure_dir, list_files
+from ml.common.date_utils import now_str
 
 # -------------------------------------------------------
 # 全域設定
@@ -240,26 +241,25 @@ def detect_release_rounds(df: pd.DataFrame, official_release_date: datetime):
     inactive_streak_weeks = 0  # 連續無票房週數（用於偵測中斷）
 
     # === 逐週檢查票房連續性 ===
-    for _, row in df.iterrows():
-        amount = row["amount"]
-
+    # 只需 amount 一欄，逐值走訪並記錄位置，最後以 iloc 一次切出各輪（不必每週建立一個 Series）
+    for pos, amount in enumerate(df["amount"].to_numpy()):
         if amount > 0:
             # 有票房 → 視為活躍週
             inactive_streak_weeks = 0
-            current_round.append(row)
+            current_round.append(pos)
         else:
             # 無票房 → 累計中斷週數
             inactive_streak_weeks += 1
 
             # 若連續無票房週數超過容忍週數 → 結束當前輪次
             if inactive_streak_weeks >= MAX_GAP_WEEKS and current_round:
-                rounds.append(pd.DataFrame(current_round))
+                rounds.append(df.iloc[current_round])
                 current_round = []
                 inactive_streak_weeks = 0
 
     # 若結束時仍有未封閉的輪次 → 加入結果
     if current_round:
-        rounds.append(pd.DataFrame(current_round))
+        rounds.append(df.iloc[current_round])
 
     return rounds
 
@@ -386,7 +386,7 @@ def aggregate_single_round(
         "status": status,  # 上映狀態
         "release_initial_date": release_initial_date,  # 該電影首輪起始日期（跨輪參考指標）
         # === 系統欄位 ===
-        "update_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),  # 資料生成時間戳
+        "update_at": now_str(),  # 資料生成時間戳
         # === 即時動態指標(for上映中電影) ===
         "momentum_score": momentum_score,
         "promotion_urgency_score": promotion_urgency_score,
@@ -395,7 +395,7 @@ def aggregate_single_round(
         "momentum_status": momentum_status,
         "promotion_level": promotion_level,
         "avg_ticket_price": avg_ticket_price,
-        "update_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "update_at": now_str(),
     }
     """NOTE: 這裡都是每一活躍週期(round)的指標，跨週期的指標會在生成最新輪整併檔(latest)時加入"""
     """NOTE: 即時動態指標
@@ -410,7 +410,7 @@ def aggregate_single_round(
 def integrate_boxoffice():
     print("🚀 開始進行票房聚合（多輪上映 + 容忍小間斷）...")
     # 取得所有單一電影票房的"檔案名稱"
-    files = [f for f in os.listdir(INPUT_DIR) if f.endswith(".csv")]
+    files = list_files(INPUT_DIR, "csv")
     all_rounds = []
 
     # 遍歷 csv
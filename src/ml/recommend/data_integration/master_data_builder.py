@@ -31,8 +31,11 @@ def build_master_dataset():
     df_gov = pd.read_csv(MOVIEINFO_PATH)
     df_box = pd.read_csv(BOXOFFICE_PATH)
 
-    # 核心整併
-    df = pd.merge(df_box, df_gov, on="gov_id", how="left")
+    # 同一 gov_id 可能有多筆電影資訊（例如重映版片名不同），保留最後一筆
+    df_gov = df_gov.drop_duplicates("gov_id", keep="last")
+
+    # 核心整併（validate 確保每個 gov_id 只對應一筆電影資訊，重複時直接報錯而非悄悄展開列數）
+    df = pd.merge(df_box, df_gov, on="gov_id", how="left", validate="m:1")
 
     # -------------------------------------------------
     # 3️⃣ 調整欄位名
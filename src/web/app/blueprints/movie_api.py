@@ -7,7 +7,7 @@
 
 from flask import Blueprint, request, jsonify
 import pandas as pd
-import json
+import orjson
 import os
 from pathlib import Path
 from datetime import datetime
@@ -25,10 +25,8 @@ BOXOFFICE_PERMOVIE_FULL_DIR = BASE_DIR / 'data' / 'raw' / 'boxoffice_permovie' /
 def get_latest_movieinfo_csv():
     """取得最新的 movieInfo CSV 檔案"""
     try:
-        csv_files = sorted(MOVIEINFO_DIR.glob('movieInfo_gov_full_*.csv'), reverse=True)
-        if not csv_files:
-            return None
-        return csv_files[0]
+        # 檔名含日期，字典序最大者即最新；單次走訪取最大值，不需排序整份清單
+        return max(MOVIEINFO_DIR.glob('movieInfo_gov_full_*.csv'), default=None)
     except Exception as e:
         print(f"Error finding latest CSV: {e}")
         return None
@@ -79,8 +77,8 @@ def debug_search():
 
     for json_file in json_files:
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(json_file, 'rb') as f:
+                data = orjson.loads(f.read())
                 if 'data' in data and 'dataItems' in data['data']:
                     for item in data['data']['dataItems']:
                         movie_id = item.get('movieId')
@@ -136,8 +134,8 @@ def search_movie():
 
         for json_file in json_files:
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(json_file, 'rb') as f:
+                    data = orjson.loads(f.read())
                     if 'data' in data and 'dataItems' in data['data']:
                         for item in data['data']['dataItems']:
                             movie_id = item.get('movieId')
@@ -273,8 +271,8 @@ def movie_boxoffice(movid):
 
         # 讀取第一個符合的檔案
         json_file = json_files[0]
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_file, 'rb') as f:
+            data = orjson.loads(f.read())
 
         # 檢查資料格式
         if not data.get('success') or 'data' not in data:
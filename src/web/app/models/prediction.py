@@ -3,7 +3,6 @@
 說明: 封裝機器學習模型，提供預測功能
 """
 
-import joblib
 import numpy as np
 import pandas as pd
 from typing import List, Dict, Optional, Tuple
@@ -18,6 +17,7 @@ sys.path.insert(0, str(src_root))
 sys.path.insert(0, str(ml_boxoffice_path))
 
 from ml.boxoffice.common.feature_engineering import BoxOfficeFeatureEngineer
+from ml.boxoffice.common.model_loader import load_model_cached
 from ..utils.box_office_utils import calculate_decline_rate
 
 class BoxOfficePredictionModel:
@@ -47,7 +47,7 @@ class BoxOfficePredictionModel:
             # 載入線性迴歸模型（模型是以 tuple 形式儲存：(model, feature_columns)）
             lr_path = model_path / 'model_linear_regression.pkl'
             if lr_path.exists():
-                self.model, self.feature_columns = joblib.load(lr_path)
+                self.model, self.feature_columns = load_model_cached(str(lr_path))
                 print(f"[OK] 已載入線性迴歸模型: {lr_path}")
                 print(f"[OK] 已載入特徵欄位，共 {len(self.feature_columns)} 個特徵")
             else:
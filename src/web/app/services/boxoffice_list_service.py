@@ -3,7 +3,7 @@
 處理電影票房列表的資料讀取、篩選、排序、分頁
 """
 
-import json
+import orjson
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -176,8 +176,8 @@ class BoxOfficeListService:
             JSON資料字典
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             print(f"讀取檔案失敗 {file_path}: {e}")
             return None
@@ -9,6 +9,16 @@ from pathlib import Path
 from typing import Dict, Optional
 import json
 
+# 計算衰退率統計實際用到的欄位（訓練資料其餘數十個特徵欄位不需解析）
+STATISTICS_COLUMNS = [
+    'gov_id',
+    'open_week1_boxoffice_daily_avg',
+    'open_week2_boxoffice',
+    'amount',
+    'boxoffice_week_1',
+    'current_week_active_idx',
+]
+
 
 class DeclineStatistics:
     """衰退率統計類別"""
@@ -53,8 +63,8 @@ class DeclineStatistics:
         if self.training_data_path is None:
             raise FileNotFoundError("找不到訓練資料檔案")
 
-        # 讀取訓練資料
-        df = pd.read_csv(self.training_data_path)
+        # 讀取訓練資料（只讀統計需要的欄位）
+        df = pd.read_csv(self.training_data_path, usecols=STATISTICS_COLUMNS)
 
         # 計算統計資料
         self.statistics = self._compute_statistics(df)
@@ -159,15 +169,13 @@ class DeclineStatistics:
         if not data_dir.exists():
             return None
 
-        # 尋找所有 prepared_data 目錄下的 preprocessed_full.csv
-        csv_files = list(data_dir.glob("*/prepared_data/preprocessed_full.csv"))
-
-        if not csv_files:
-            return None
-
-        # 按修改時間排序，取最新的
-        csv_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-        return csv_files[0]
+        # 尋找所有 prepared_data 目錄下的 preprocessed_full.csv，取修改時間最新的
+        # （單次走訪取最大值，不需排序整份清單；沒有檔案時回傳 None）
+        return max(
+            data_dir.glob("*/prepared_data/preprocessed_full.csv"),
+            key=lambda x: x.stat().st_mtime,
+            default=None,
+        )
 
     def _save_cache(self):
         """儲存快取到檔案"""
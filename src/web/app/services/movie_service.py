@@ -6,7 +6,7 @@
 
 from __future__ import annotations
 
-import json
+import orjson
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -356,8 +356,8 @@ class MovieService:
 
         # 讀取並解析 JSON
         try:
-            payload = json.loads(file_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+            payload = orjson.loads(file_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
             return None
 
         # 提取 data 欄位
@@ -3,7 +3,7 @@
 處理首頁統計卡片的資料邏輯
 """
 
-import json
+import orjson
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -53,8 +53,8 @@ class StatsService:
             週票房資料字典，如果讀取失敗則返回 None
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return orjson.loads(f.read())
         except Exception as e:
             print(f"讀取檔案失敗 {file_path}: {e}")
             return None
@@ -6,6 +6,9 @@
 import re
 from typing import Any, Optional, Tuple
 
+# 政府代號格式：假設為 MOV 開頭加數字，或 4 碼以上純數字（模組載入時編譯一次）
+GOV_ID_RE = re.compile(r'^(MOV\d{3,}|\d{4,})$')
+
 def validate_gov_id(gov_id: str) -> Tuple[bool, Optional[str]]:
     """
     驗證政府代號格式
@@ -19,9 +22,7 @@ def validate_gov_id(gov_id: str) -> Tuple[bool, Optional[str]]:
     if not gov_id:
         return False, "政府代號不能為空"
     
-    # 假設格式為 MOV 開頭加數字
-    pattern = r'^(MOV\d{3,}|\d{4,})$'
-    if not re.match(pattern, gov_id):
+    if not GOV_ID_RE.match(gov_id):
         return False, "政府代號格式無效"
     
     return True, None
@@ -0,0 +1,58 @@
+"""
+boxoffice_permovie 清洗測試：片名變更（重映版）時，同一 gov_id 只保留最新的輸出檔
+"""
+
+import orjson
+import pytest
+
+from ml.pipelines.data_cleaning import boxoffice_permovie
+
+
+def _write_raw(path, gov_id: str, title: str) -> str:
+    week = {
+        "date": "2025-09-15~2025-09-21",
+        "amount": 1260067.0,
+        "tickets": 4583,
+        "totalAmount": 1260067.0,
+        "totalTickets": 4583,
+        "rate": 0,
+        "theaterCount": 25,
+    }
+    data = {"movieId": gov_id, "name": title, "releaseDate": "2025-10-01", "filmMembers": [], "weeks": [week]}
+    path.write_bytes(orjson.dumps({"data": data}))
+    return str(path)
+
+
+@pytest.fixture
+def dirs(tmp_path, monkeypatch):
+    info_dir = tmp_path / "movieInfo_gov"
+    output_dir = tmp_path / "boxoffice_permovie"
+    monkeypatch.setattr(boxoffice_permovie, "MOVIEINFO_GOV_PROCESSED", str(info_dir))
+    return tmp_path, info_dir, output_dir
+
+
+def test_retitled_movie_keeps_only_latest_files(dirs):
+    tmp_path, info_dir, output_dir = dirs
+
+    # 另一部 gov_id 前綴相同的電影不應被刪除
+    other = _write_raw(tmp_path / "228941.json", "228941", "其他")
+    old = _write_raw(tmp_path / "old.json", "22894", "一一 25周年4K數位修復版")
+    new = _write_raw(tmp_path / "new.json", "22894", "一一")
+
+    for raw in (other, old, new):
+        assert boxoffice_permovie.clean_permovie_file(raw, str(output_dir)) == "success"
+
+    expected = ["228941_其他.csv", "22894_一一.csv"]
+    assert sorted(p.name for p in info_dir.iterdir()) == expected
+    assert sorted(p.name for p in output_dir.iterdir()) == expected
+
+
+def test_same_title_overwrites_in_place(dirs):
+    tmp_path, info_dir, output_dir = dirs
+    raw = _write_raw(tmp_path / "raw.json", "22894", "一一")
+
+    boxoffice_permovie.clean_permovie_file(raw, str(output_dir))
+    boxoffice_permovie.clean_permovie_file(raw, str(output_dir))
+
+    assert [p.name for p in info_dir.iterdir()] == ["22894_一一.csv"]
+    assert [p.name for p in output_dir.iterdir()] == ["22894_一一.csv"]
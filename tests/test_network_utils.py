@@ -0,0 +1,187 @@
+"""
+network_utils 限流器測試：以假時鐘取代 time / asyncio.sleep，不實際等待
+"""
+
+import asyncio
+from email.utils import format_datetime, parsedate_to_datetime
+from types import SimpleNamespace
+
+import pytest
+
+from ml.common import network_utils
+from ml.common.network_utils import AsyncRateLimiter, RateLimiter, parse_retry_after
+
+
+class FakeClock:
+    """假時鐘：sleep 只推進時間並記錄等待秒數"""
+
+    def __init__(self, start: float = 1000.0):
+        self.now = start
+        self.sleeps = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(network_utils, "time", clock)
+    monkeypatch.setattr(
+        network_utils,
+        "asyncio",
+        SimpleNamespace(
+            Condition=asyncio.Condition,
+            CancelledError=asyncio.CancelledError,
+            sleep=clock.async_sleep,
+        ),
+    )
+    return clock
+
+
+async def _acquire_release(limiter: AsyncRateLimiter) -> None:
+    await limiter.acquire()
+    await limiter.release()
+
+
+# -------------------------------
+# RateLimiter（同步）
+# -------------------------------
+def test_rate_limiter_waits_for_window(clock):
+    limiter = RateLimiter(rpm=2, window=60)
+
+    limiter.acquire()
+    clock.now += 10
+    limiter.acquire()
+    assert clock.sleeps == []
+
+    # 第三個請求要等到第一個請求滑出視窗
+    limiter.acquire()
+    assert clock.sleeps == [50]
+    assert clock.now == 1060
+
+
+# -------------------------------
+# AsyncRateLimiter
+# -------------------------------
+def test_async_rate_limiter_waits_for_window(clock):
+    limiter = AsyncRateLimiter(rpm=2, max_concurrency=5, window=60)
+
+    async def run():
+        for _ in range(3):
+            await _acquire_release(limiter)
+
+    asyncio.run(run())
+    assert clock.sleeps == [60]
+
+
+def test_async_rate_limiter_returns_slot_when_cancelled(clock, monkeypatch):
+    limiter = AsyncRateLimiter(rpm=1, max_concurrency=1, window=60)
+
+    async def blocking_sleep(seconds):
+        await asyncio.Event().wait()
+
+    async def run():
+        await _acquire_release(limiter)
+
+        # 第二個請求卡在等待視窗額度時被取消
+        monkeypatch.setattr(network_utils.asyncio, "sleep", blocking_sleep)
+        task = asyncio.create_task(limiter.acquire())
+        for _ in range(3):
+            await asyncio.sleep(0)
+        assert limiter._in_flight == 1
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+    assert limiter._in_flight == 0
+
+
+def test_async_rate_limiter_halves_on_429_and_retry_after(clock):
+    limiter = AsyncRateLimiter(rpm=100, max_concurrency=8, window=60)
+
+    limiter.on_response(429, {})
+    assert limiter.concurrency == 4
+
+    limiter.on_response(200, {"Retry-After": "5"})
+    assert limiter.concurrency == 2
+
+    limiter.on_response(503, {})
+    limiter.on_response(503, {})
+    assert limiter.concurrency == 1  # 下限為 1
+
+    # Retry-After 期間 acquire 需等待
+    asyncio.run(_acquire_release(limiter))
+    assert clock.sleeps == [5]
+
+
+def test_async_rate_limiter_increases_after_successes(clock):
+    limiter = AsyncRateLimiter(rpm=100, max_concurrency=4, window=60, increase_after=3)
+    limiter.on_response(429, {})
+    assert limiter.concurrency == 2
+
+    for _ in range(2):
+        limiter.on_response(200, {})
+    assert limiter.concurrency == 2
+
+    limiter.on_response(200, {})
+    assert limiter.concurrency == 3
+
+    # 失敗會重新計算連續成功次數
+    limiter.on_response(200, {})
+    limiter.on_response(500, {})
+    limiter.on_response(200, {})
+    limiter.on_response(200, {})
+    assert limiter.concurrency == 1
+
+    for _ in range(30):
+        limiter.on_response(200, {})
+    assert limiter.concurrency == 4  # 不超過 max_concurrency
+
+
+def test_async_rate_limiter_pauses_when_remaining_low(clock):
+    limiter = AsyncRateLimiter(rpm=100, max_concurrency=4, window=60)
+
+    # 剩餘 10%（未低於）不暫停
+    limiter.on_response(200, {"X-RateLimit-Remaining": "10", "X-RateLimit-Limit": "100"})
+    asyncio.run(_acquire_release(limiter))
+    assert clock.sleeps == []
+
+    limiter.on_response(200, {"X-RateLimit-Remaining": "9", "X-RateLimit-Limit": "100"})
+    asyncio.run(_acquire_release(limiter))
+    assert clock.sleeps == [60]
+    assert limiter.concurrency == 4
+
+
+# -------------------------------
+# parse_retry_after
+# -------------------------------
+@pytest.mark.parametrize(
+    "value, expected",
+    [("120", 120.0), ("1.5", 1.5), ("-3", 0.0), ("", None), (None, None), ("soon", None)],
+)
+def test_parse_retry_after_seconds(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_parse_retry_after_http_date(clock):
+    retry_at = parsedate_to_datetime("Wed, 21 Oct 2015 07:28:00 GMT")
+    clock.now = retry_at.timestamp() - 30
+
+    assert parse_retry_after(format_datetime(retry_at, usegmt=True)) == pytest.approx(30)
+
+    # 已過期的日期回傳 0
+    clock.now = retry_at.timestamp() + 30
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
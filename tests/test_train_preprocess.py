@@ -0,0 +1,52 @@
+"""
+train_preprocess 快取測試：同一輸入檔只保留一份快取，輸入變動時覆寫而非新增
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from ml.boxoffice.common import train_preprocess
+
+
+def _write_dataset(path, n_rows: int) -> None:
+    pd.DataFrame(
+        {
+            "gov_id": range(n_rows),
+            "round_idx": 1,
+            "current_week_active_idx": 1,
+            "boxoffice_week_1": 100.0,
+            "boxoffice_week_2": 50.0,
+            "release_month": 3,
+        }
+    ).to_csv(path, index=False)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "_cache"
+    monkeypatch.setattr(train_preprocess, "PREPROCESS_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+def test_cache_is_reused_then_replaced(tmp_path, cache_dir, capsys):
+    input_path = tmp_path / "features.csv"
+    exclude_path = tmp_path / "exclude.csv"
+    exclude_path.write_text("gov_id\n")
+
+    _write_dataset(input_path, 3)
+    assert len(train_preprocess.load_preprocessed_dataset(input_path, str(exclude_path))) == 3
+
+    capsys.readouterr()
+    assert len(train_preprocess.load_preprocessed_dataset(input_path, str(exclude_path))) == 3
+    assert "使用前處理快取" in capsys.readouterr().out
+
+    # 輸入檔變動：重新前處理並覆寫同一份快取
+    _write_dataset(input_path, 5)
+    stat = input_path.stat()
+    os.utime(input_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert len(train_preprocess.load_preprocessed_dataset(input_path, str(exclude_path))) == 5
+
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+    assert len(list(cache_dir.glob("*.key"))) == 1
@@ -0,0 +1,42 @@
+"""
+tree_predictor 測試：匯出陣列的預測結果須與 sklearn 完全一致（含 NaN 輸入）
+"""
+
+import numpy as np
+from sklearn.tree import DecisionTreeRegressor
+
+from ml.boxoffice.common.tree_predictor import (
+    export_tree_arrays,
+    load_tree_arrays,
+    predict_tree_arrays,
+    save_tree_arrays,
+)
+
+
+def _fit_tree_with_nan():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 3))
+    y = 3 * X[:, 0] - 2 * X[:, 1] + rng.normal(scale=0.1, size=200)
+    # 讓大的 X[:, 0] 缺值，訓練時 NaN 會被分到特定子樹
+    X[X[:, 0] > 1.0, 0] = np.nan
+    X[rng.random(200) < 0.1, 2] = np.nan
+    return DecisionTreeRegressor(max_depth=5, random_state=0).fit(X, y), X
+
+
+def test_predict_matches_sklearn_with_nan():
+    dt_model, X = _fit_tree_with_nan()
+    X_test = X.copy()
+    X_test[:20, 1] = np.nan  # 訓練時沒有缺值的欄位
+
+    expected = dt_model.predict(X_test)
+    actual = predict_tree_arrays(X_test, export_tree_arrays(dt_model))
+
+    np.testing.assert_array_equal(actual, expected)
+
+
+def test_saved_arrays_round_trip(tmp_path):
+    dt_model, X = _fit_tree_with_nan()
+    file_path = tmp_path / "tree.npz"
+    save_tree_arrays(dt_model, file_path)
+
+    np.testing.assert_array_equal(predict_tree_arrays(X, load_tree_arrays(file_path)), dt_model.predict(X))